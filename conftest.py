@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+import urllib3
+
+from ses_account_monitor.clients.http_client import POOL_MANAGER
+
+
+class PoolManagerStub(object):
+    '''
+    Stubs the shared urllib3 pool manager, responses are registered by method and url.
+    '''
+
+    def __init__(self):
+        self.responses = {}
+        self.requests = []
+
+    def add(self, method, url, status=200, json_body=None):
+        self.responses[(method, url)] = (status, json.dumps(json_body).encode('utf-8'))
+
+    def urlopen(self, method, url, body=None, headers=None, **kwargs):
+        self.requests.append((method, url, body, headers))
+        status, data = self.responses[(method, url)]
+        return urllib3.HTTPResponse(body=data, status=status, preload_content=True)
+
+
+@pytest.fixture
+def http_stub(monkeypatch):
+    stub = PoolManagerStub()
+    monkeypatch.setattr(POOL_MANAGER, 'urlopen', stub.urlopen)
+    return stub
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+
+import logging
+
+from ses_account_monitor.config import LOG_LEVEL
+
+logging.getLogger(__name__).setLevel(LOG_LEVEL)
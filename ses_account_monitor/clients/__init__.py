@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 
-from ses_account_monitor.clients.http_client import HttpClient
+from ses_account_monitor.clients.aws_client import build_aws_client
+from ses_account_monitor.clients.http_client import (
+    HttpClient,
+    HttpResponse)
 
-__all__ = ['HttpClient']
+__all__ = ['build_aws_client', 'HttpClient', 'HttpResponse']
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+'''
+ses_account_monitor.clients.aws_client
+~~~~~~~~~~~~~~~~
+
+AWS client module.
+'''
+
+from functools import lru_cache
+
+from ses_account_monitor.config import (
+    LAMBDA_AWS_CLIENT_CONFIG,
+    LAMBDA_AWS_SESSION_CONFIG)
+
+
+@lru_cache(maxsize=1)
+def get_default_session():
+    '''
+    Get the boto3 session built from the Lambda session config, it is created once and shared by every client.
+
+    Returns:
+        obj (boto3.session.Session): The boto3 session.
+    '''
+
+    import boto3
+
+    return boto3.Session(**LAMBDA_AWS_SESSION_CONFIG)
+
+
+def build_aws_client(service_name, session_config=None):
+    '''
+    Build a AWS client, if a session config is provided, it will use it to create the client.
+    Otherwise the shared default session is used, so the clients reuse one credential resolver and model loader.
+
+    boto3 is imported on the first call, so the import and the service model load are deferred until a client is needed.
+
+    Args:
+        service_name (str): The AWS service name. Ex: ses, cloudwatch.
+        session_config (:obj:`dict`, optional):
+            aws_access_key_id (str): AWS access key ID.
+            aws_secret_access_key (str): AWS secret access key.
+            aws_session_token (str): AWS temporary session token.
+            region_name (str): Default region when creating new connections.
+            botocore_session (botocore.session.Session): Use this Botocore session instead of creating a new default one.
+            profile_name (str): The name of a profile to use. If not given, then the default profile is used.
+
+    Returns:
+        obj (botocore.client.BaseClient): The AWS client.
+    '''
+
+    import boto3
+
+    from botocore.config import Config
+
+    if session_config:
+        session = boto3.Session(**session_config)
+    else:
+        session = get_default_session()
+
+    return session.client(service_name, config=Config(**LAMBDA_AWS_CLIENT_CONFIG))
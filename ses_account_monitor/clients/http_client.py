@@ -4,31 +4,99 @@
 ses_account_monitor.clients.http_client
 ~~~~~~~~~~~~~~~~
 
-HTTP client module, it's a wrapper around requests.
+HTTP client module, it's a wrapper around urllib3.
 '''
 
+import json
 import logging
 
-from botocore.vendored import requests
+import urllib3
+
+from ses_account_monitor.config import (
+    LAMBDA_HTTP_CONNECT_TIMEOUT,
+    LAMBDA_HTTP_READ_TIMEOUT)
 
 from ses_account_monitor.util import (
+    json_dump,
     json_dump_request_event,
     json_dump_response_event)
 
 
+RETRY = urllib3.Retry(total=3,
+                      connect=3,
+                      read=0,
+                      status=3,
+                      backoff_factor=0.5,
+                      status_forcelist=(429,),
+                      allowed_methods=frozenset(('GET', 'POST')),
+                      respect_retry_after_header=False,
+                      raise_on_status=False)
+'''
+obj (urllib3.Retry): Retry policy, only retries requests that were not accepted: connection errors and 429 responses.
+    Read errors and 5XX responses are not retried, the Slack webhook is not idempotent and could post a duplicate.
+    Retry-After headers are ignored, so the backoff stays within a few seconds instead of outlasting the Lambda timeout.
+    The last response is returned once retries are exhausted, so callers can still review the status code.
+'''
+
+TIMEOUT = urllib3.Timeout(connect=LAMBDA_HTTP_CONNECT_TIMEOUT,
+                          read=LAMBDA_HTTP_READ_TIMEOUT)
+'''
+obj (urllib3.Timeout): Connect and read timeouts, so a slow notification endpoint can not hold the Lambda until it times out.
+'''
+
+POOL_MANAGER = urllib3.PoolManager(maxsize=4,
+                                   retries=RETRY,
+                                   timeout=TIMEOUT)
+'''
+obj (urllib3.PoolManager): Connection pool shared by all HTTP clients, keeps connections alive between requests and invocations.
+'''
+
+
+class HttpResponse(object):
+    '''
+    HttpResponse class, a thin wrapper around urllib3.HTTPResponse exposing the attributes used by the services.
+    '''
+
+    def __init__(self, url, response):
+        '''
+        Args:
+            url (str): The url the request was sent to.
+            response (urllib3.HTTPResponse): The response object.
+        '''
+
+        self.url = url
+        self.status_code = response.status
+        self.data = response.data
+
+    def json(self):
+        '''
+        Deserializes the response body as JSON.
+
+        Returns:
+            dict/list/str/int/float/NoneType: Deserialized response body. None if the body is not valid JSON.
+        '''
+
+        try:
+            return json.loads(self.data.decode('utf-8'))
+        except ValueError:
+            return None
+
+
 class HttpClient(object):
     '''
     HttpClient class, used as a base class.
     '''
 
-    def __init__(self, url, logger=None):
+    def __init__(self, url, logger=None, pool_manager=None):
         '''
         Args:
             url (str): Event triggering the function.
             logger (:obj:`logging.Logger`, optional): Logger instance. Defaults to None, which will create a logger instance.
+            pool_manager (:obj:`urllib3.PoolManager`, optional): Connection pool. Defaults to None, which will use the shared pool.
         '''
 
         self._logger = (logger or self._build_logger())
+        self._pool_manager = (pool_manager or POOL_MANAGER)
         self.url = url
 
     @property
@@ -41,20 +109,22 @@ class HttpClient(object):
 
     def post_json(self, payload):
         '''
-        Sends a JSON payload via the requests http client module.
+        Sends a JSON payload via the shared urllib3 connection pool.
 
         Args:
             payload (dict): Dict containing the POST params.
 
         Returns:
-            response (requests.Response): Response object.
+            response (HttpResponse): Response object.
         '''
 
         self._log_post_json_request(self.url, payload)
 
-        response = requests.post(
-            self.url,
-            json=payload)
+        response = HttpResponse(self.url,
+                                self._pool_manager.request('POST',
+                                                           self.url,
+                                                           body=json_dump(payload).encode('utf-8'),
+                                                           headers={'Content-Type': 'application/json'}))
 
         self._log_post_json_response(response)
 
@@ -69,7 +139,10 @@ class HttpClient(object):
         '''
 
         logger = logging.getLogger(self.__module__)
-        logger.addHandler(logging.NullHandler())
+
+        if not logger.handlers:
+            logger.addHandler(logging.NullHandler())
+
         return logger
 
     def _log_post_json_request(self, url, payload):
@@ -83,13 +156,14 @@ class HttpClient(object):
 
         self.logger.debug('Sending POST outbound request to %s', url)
 
-        self.logger.info(
-            json_dump_request_event(class_name=self.__class__.__name__,
-                                    method_name='post_json',
-                                    params=payload,
-                                    details={
-                                        'url': url
-                                    }))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                json_dump_request_event(class_name=self.__class__.__name__,
+                                        method_name='post_json',
+                                        params=payload,
+                                        details={
+                                            'url': url
+                                        }))
 
     def _log_post_json_response(self, response):
         '''
@@ -97,18 +171,19 @@ class HttpClient(object):
 
         Args:
             url (str): The url being posted to.
-            response (requests.Response): Response object.
+            response (HttpResponse): Response object.
         '''
 
         self.logger.debug('Received POST %s response from %s',
                           response.status_code,
                           response.url)
 
-        self.logger.info(
-            json_dump_response_event(class_name=self.__class__.__name__,
-                                     method_name='post_json',
-                                     response=response.json(),
-                                     details={
-                                         'url': response.url,
-                                         'status_code': response.status_code
-                                     }))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                json_dump_response_event(class_name=self.__class__.__name__,
+                                         method_name='post_json',
+                                         response=response.json(),
+                                         details={
+                                             'url': response.url,
+                                             'status_code': response.status_code
+                                         }))
@@ -9,12 +9,20 @@ SES account monitor config module.
 
 import os
 
-from distutils.util import strtobool
+from types import MappingProxyType
 
 from ses_account_monitor.configs import (
     NotifyConfig,
     PagerDutyServiceConfig,
     SlackServiceConfig)
+from ses_account_monitor.util import (
+    get_log_level,
+    strtobool)
+
+_env = os.environ.copy()
+'''
+dict: Snapshot of the environment taken at import, every setting is read from it.
+'''
 
 
 # STATIC CONSTANTS
@@ -26,62 +34,86 @@ ACTION_DISABLE = 'disable'
 
 SES_MONITOR_STRATEGY_MANAGED = 'managed'
 SES_MONITOR_STRATEGY_ALERT = 'alert'
+SES_MONITOR_STRATEGIES = frozenset((SES_MONITOR_STRATEGY_MANAGED, SES_MONITOR_STRATEGY_ALERT))
 
 THRESHOLD_CRITICAL = 'CRITICAL'
 THRESHOLD_OK = 'OK'
 THRESHOLD_WARNING = 'WARNING'
 
 # LAMBDA CONSTANTS
-LAMBDA_AWS_ACCOUNT_NAME = os.getenv('LAMBDA_AWS_ACCOUNT_NAME', 'undefined')
-LAMBDA_AWS_REGION = os.getenv('LAMBDA_AWS_REGION', os.getenv('AWS_DEFAULT_REGION', None))
-LAMBDA_AWS_SESSION_CONFIG = {
+LAMBDA_AWS_ACCOUNT_NAME = _env.get('LAMBDA_AWS_ACCOUNT_NAME', 'undefined')
+LAMBDA_AWS_REGION = _env.get('LAMBDA_AWS_REGION', _env.get('AWS_DEFAULT_REGION', None))
+LAMBDA_AWS_SESSION_CONFIG = MappingProxyType({
     'region_name': LAMBDA_AWS_REGION
+})
+LAMBDA_AWS_CLIENT_CONFIG = {
+    'tcp_keepalive': True,
+    'connect_timeout': int(_env.get('LAMBDA_AWS_CONNECT_TIMEOUT', 3)),
+    'read_timeout': int(_env.get('LAMBDA_AWS_READ_TIMEOUT', 10)),
+    'retries': {
+        'max_attempts': int(_env.get('LAMBDA_AWS_MAX_ATTEMPTS', 3)),
+        'mode': 'standard'
+    }
 }
-LAMBDA_ENVIRONMENT = os.getenv('LAMBDA_ENVIRONMENT', 'undefined')
-LAMBDA_NAME = os.getenv('LAMBDA_NAME', 'ses-account-monitor')
-LAMBDA_SERVICE_NAME = os.getenv('LAMBDA_SERVICE_NAME',
-                                '{account}-{region}-{environment}-{name}'.format(account=LAMBDA_AWS_ACCOUNT_NAME,
-                                                                                 region=LAMBDA_AWS_REGION,
-                                                                                 environment=LAMBDA_ENVIRONMENT,
-                                                                                 name=LAMBDA_NAME))
+LAMBDA_ENVIRONMENT = _env.get('LAMBDA_ENVIRONMENT', 'undefined')
+LAMBDA_HTTP_CONNECT_TIMEOUT = int(_env.get('LAMBDA_HTTP_CONNECT_TIMEOUT', 3))
+LAMBDA_HTTP_READ_TIMEOUT = int(_env.get('LAMBDA_HTTP_READ_TIMEOUT', 10))
+LAMBDA_NAME = _env.get('LAMBDA_NAME', 'ses-account-monitor')
+LAMBDA_PREWARM_CLIENTS = strtobool(_env.get('LAMBDA_PREWARM_CLIENTS', 'False'))
+LAMBDA_SERVICE_NAME = (_env.get('LAMBDA_SERVICE_NAME') or
+                       '{account}-{region}-{environment}-{name}'.format(account=LAMBDA_AWS_ACCOUNT_NAME,
+                                                                        region=LAMBDA_AWS_REGION,
+                                                                        environment=LAMBDA_ENVIRONMENT,
+                                                                        name=LAMBDA_NAME))
 
 # LOG CONSTANTS
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_LEVEL = get_log_level(_env.get('LOG_LEVEL', 'INFO'))
 
 # MONITOR CONSTANTS
-MONITOR_SES_REPUTATION = strtobool(os.getenv('MONITOR_SES_REPUTATION', 'True'))
-MONITOR_SES_SENDING_QUOTA = strtobool(os.getenv('MONITOR_SES_SENDING_QUOTA', 'True'))
+MONITOR_SES_REPUTATION = strtobool(_env.get('MONITOR_SES_REPUTATION', 'True'))
+MONITOR_SES_SENDING_QUOTA = strtobool(_env.get('MONITOR_SES_SENDING_QUOTA', 'True'))
 
 # NOTIFY CONSTANTS
-NOTIFY_DRY_RUN = strtobool(os.getenv('NOTIFY_DRY_RUN', 'False'))
-NOTIFY_PAGER_DUTY_ON_SES_REPUTATION = strtobool(os.getenv('NOTIFY_PAGER_DUTY_ON_SES_REPUTATION', 'False'))
-NOTIFY_PAGER_DUTY_ON_SES_SENDING_QUOTA = strtobool(os.getenv('NOTIFY_PAGER_DUTY_ON_SES_SENDING_QUOTA', 'False'))
-NOTIFY_SLACK_ON_SES_REPUTATION = strtobool(os.getenv('NOTIFY_SLACK_ON_SES_REPUTATION', 'False'))
-NOTIFY_SLACK_ON_SES_SENDING_QUOTA = strtobool(os.getenv('NOTIFY_SLACK_ON_SES_SENDING_QUOTA', 'False'))
+NOTIFY_DRY_RUN = strtobool(_env.get('NOTIFY_DRY_RUN', 'False'))
+NOTIFY_PAGER_DUTY_ON_SES_REPUTATION = strtobool(_env.get('NOTIFY_PAGER_DUTY_ON_SES_REPUTATION', 'False'))
+NOTIFY_PAGER_DUTY_ON_SES_SENDING_QUOTA = strtobool(_env.get('NOTIFY_PAGER_DUTY_ON_SES_SENDING_QUOTA', 'False'))
+NOTIFY_SLACK_ON_SES_REPUTATION = strtobool(_env.get('NOTIFY_SLACK_ON_SES_REPUTATION', 'False'))
+NOTIFY_SLACK_ON_SES_SENDING_QUOTA = strtobool(_env.get('NOTIFY_SLACK_ON_SES_SENDING_QUOTA', 'False'))
 
 # PAGERDUTY CONSTANTS
-PAGER_DUTY_EVENTS_URL = os.getenv('PAGER_DUTY_EVENTS_URL', 'https://events.pagerduty.com/v2/enqueue')
-PAGER_DUTY_ROUTING_KEY = os.getenv('PAGER_DUTY_ROUTING_KEY', None)
+PAGER_DUTY_EVENTS_URL = _env.get('PAGER_DUTY_EVENTS_URL', 'https://events.pagerduty.com/v2/enqueue')
+PAGER_DUTY_ROUTING_KEY = _env.get('PAGER_DUTY_ROUTING_KEY', None)
 
 # SES CONSTANTS
-SES_BOUNCE_RATE_CRITICAL_PERCENT = float(os.getenv('SES_BOUNCE_RATE_CRITICAL_PERCENT', 8))
-SES_BOUNCE_RATE_WARNING_PERCENT = float(os.getenv('SES_BOUNCE_RATE_WARNING_PERCENT', 5))
+SES_BOUNCE_RATE_CRITICAL_PERCENT = float(_env.get('SES_BOUNCE_RATE_CRITICAL_PERCENT', 8))
+SES_BOUNCE_RATE_WARNING_PERCENT = float(_env.get('SES_BOUNCE_RATE_WARNING_PERCENT', 5))
+
+SES_COMPLAINT_RATE_CRITICAL_PERCENT = float(_env.get('SES_COMPLAINT_RATE_CRITICAL_PERCENT', 0.04))
+SES_COMPLAINT_RATE_WARNING_PERCENT = float(_env.get('SES_COMPLAINT_RATE_WARNING_PERCENT', 0.01))
 
-SES_COMPLAINT_RATE_CRITICAL_PERCENT = float(os.getenv('SES_COMPLAINT_RATE_CRITICAL_PERCENT', 0.04))
-SES_COMPLAINT_RATE_WARNING_PERCENT = float(os.getenv('SES_COMPLAINT_RATE_WARNING_PERCENT', 0.01))
+SES_SENDING_QUOTA_CACHE_TTL = float(_env.get('SES_SENDING_QUOTA_CACHE_TTL', 0))
+SES_SENDING_QUOTA_WARNING_PERCENT = float(_env.get('SES_SENDING_QUOTA_WARNING_PERCENT', 80))
+SES_SENDING_QUOTA_CRITICAL_PERCENT = float(_env.get('SES_SENDING_QUOTA_CRITICAL_PERCENT', 90))
 
-SES_SENDING_QUOTA_WARNING_PERCENT = float(os.getenv('SES_SENDING_QUOTA_WARNING_PERCENT', 80))
-SES_SENDING_QUOTA_CRITICAL_PERCENT = float(os.getenv('SES_SENDING_QUOTA_CRITICAL_PERCENT', 90))
 
-SES_BASE_URL = 'https://{region}.console.aws.amazon.com/ses/home?region={region}'.format(region=LAMBDA_AWS_REGION)
+def build_ses_base_url():
+    '''
+    Build the SES console url for the region. Only called when a console url setting is unset or empty.
 
-SES_CONSOLE_URL = os.getenv('SES_CONSOLE_URL', '{}#dashboard:'.format(SES_BASE_URL))
-SES_REPUTATION_DASHBOARD_URL = os.getenv('SES_REPUTATION_DASHBOARD_URL', '{}#reputation-dashboard:'.format(SES_BASE_URL))
+    Returns:
+        str: The SES console url.
+    '''
 
-SES_REPUTATION_PERIOD = int(os.getenv('SES_REPUTATION_PERIOD', 900))
-SES_REPUTATION_METRIC_TIMEDELTA = int(os.getenv('SES_REPUTATION_METRIC_TIMEDELTA', 1800))
+    return 'https://{region}.console.aws.amazon.com/ses/home?region={region}'.format(region=LAMBDA_AWS_REGION)
 
-SES_MONITOR_STRATEGY = os.getenv('SES_MONITOR_STRATEGY', SES_MONITOR_STRATEGY_ALERT)
+
+SES_CONSOLE_URL = (_env.get('SES_CONSOLE_URL') or (build_ses_base_url() + '#dashboard:'))
+SES_REPUTATION_DASHBOARD_URL = (_env.get('SES_REPUTATION_DASHBOARD_URL') or (build_ses_base_url() + '#reputation-dashboard:'))
+
+SES_REPUTATION_PERIOD = int(_env.get('SES_REPUTATION_PERIOD', 900))
+SES_REPUTATION_METRIC_TIMEDELTA = int(_env.get('SES_REPUTATION_METRIC_TIMEDELTA', 1800))
+
+SES_MONITOR_STRATEGY = _env.get('SES_MONITOR_STRATEGY', SES_MONITOR_STRATEGY_ALERT)
 
 SES_THRESHOLDS = {
     THRESHOLD_CRITICAL: {
@@ -97,10 +129,11 @@ SES_THRESHOLDS = {
 }
 
 # SLACK CONSTANTS
-SLACK_CHANNELS = list(filter(None, os.getenv('SLACK_CHANNELS', '').split(',')))
-SLACK_FOOTER_ICON_URL = os.getenv('SLACK_FOOTER_ICON_URL', 'https://platform.slack-edge.com/img/default_application_icon.png')
-SLACK_ICON_EMOJI = os.getenv('SLACK_ICON_EMOJI', None)
-SLACK_WEBHOOK_URL = os.getenv('SLACK_WEBHOOK_URL', None)
+SLACK_CHANNELS = tuple(channel for channel in _env.get('SLACK_CHANNELS', '').split(',') if channel)
+SLACK_FOOTER_ICON_URL = _env.get('SLACK_FOOTER_ICON_URL', 'https://platform.slack-edge.com/img/default_application_icon.png')
+SLACK_ICON_EMOJI = _env.get('SLACK_ICON_EMOJI', None)
+SLACK_WEBHOOK_URL = _env.get('SLACK_WEBHOOK_URL', None)
+
 
 # CONFIGS
 NOTIFY_CONFIG = NotifyConfig(notify_pager_duty_on_ses_reputation=NOTIFY_PAGER_DUTY_ON_SES_REPUTATION,
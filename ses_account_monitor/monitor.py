@@ -9,11 +9,12 @@ SES account monitor monitor module.
 
 import logging
 
-from ses_account_monitor.services import (
-    CloudWatchService,
-    PagerDutyService,
-    SesService,
-    SlackService)
+from collections import deque
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    wait)
+from itertools import chain
+from types import MappingProxyType
 
 from ses_account_monitor.config import (
     ACTION_DISABLE,
@@ -23,7 +24,7 @@ from ses_account_monitor.config import (
     MONITOR_SES_SENDING_QUOTA,
     NOTIFY_CONFIG,
     SES_MONITOR_STRATEGY,
-    SES_MONITOR_STRATEGY_ALERT,
+    SES_MONITOR_STRATEGIES,
     SES_MONITOR_STRATEGY_MANAGED,
     SES_SENDING_QUOTA_WARNING_PERCENT,
     SES_SENDING_QUOTA_CRITICAL_PERCENT,
@@ -38,17 +39,38 @@ from ses_account_monitor.util import (
     json_dump_request_event,
     json_dump_response_event)
 
-THRESHOLDS = {
+THRESHOLDS = MappingProxyType({
     'ses_sending_quota_warning_percent': SES_SENDING_QUOTA_WARNING_PERCENT,
     'ses_sending_quota_critical_percent': SES_SENDING_QUOTA_CRITICAL_PERCENT
-}
+})
+
+NOTIFICATION_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+'''
+obj (concurrent.futures.ThreadPoolExecutor): Executor shared across invocations, sends PagerDuty and Slack notifications concurrently.
+'''
 
 
 class NotificationFailure(Exception):
     '''
     Custom exception for notification failures, inherits Exception.
     '''
-    pass
+
+    def __init__(self, message, failures=None, errors=None):
+        '''
+        Args:
+            message (str): The error message.
+            failures (:obj:`list` of :obj:`tuple`, optional): List of tuples describing each failed notification.
+                service (str): The notification service. Ex: PagerDuty, Slack.
+                key (str): The PagerDuty event id or the Slack channel.
+                status_code (int): The HTTP status code.
+            errors (:obj:`list` of :obj:`tuple`, optional): List of tuples describing each service that raised while sending.
+                service (str): The notification service. Ex: PagerDuty, Slack.
+                error (Exception): The exception raised by the service.
+        '''
+
+        super().__init__(message)
+        self.failures = (failures or [])
+        self.errors = (errors or [])
 
 
 class Monitor(object):
@@ -56,6 +78,31 @@ class Monitor(object):
     Monitor classs, retrieves SES metric data and if past set thresholds will send alerts to connected notification services.
     '''
 
+    __slots__ = ('_class_name',
+                 '_cloudwatch_client',
+                 '_cloudwatch_service',
+                 '_dbg',
+                 '_info',
+                 '_invocation_timestamps',
+                 '_is_managed',
+                 '_is_valid_strategy',
+                 '_logger',
+                 '_notify_config',
+                 '_notify_pager_duty',
+                 '_notify_ses_reputation',
+                 '_notify_ses_sending_quota',
+                 '_notify_slack',
+                 '_pager_duty_service',
+                 '_service_logger',
+                 '_ses_client',
+                 '_ses_management_strategy',
+                 '_ses_sending_quota_levels',
+                 '_ses_service',
+                 '_slack_service',
+                 '_thresholds',
+                 'monitor_ses_reputation',
+                 'monitor_ses_sending_quota')
+
     def __init__(self,
                  ses_management_strategy=None,
                  notify_config=False,
@@ -95,15 +142,34 @@ class Monitor(object):
 
         self._notify_config = (notify_config or NOTIFY_CONFIG)
         self._thresholds = (thresholds or THRESHOLDS)
+        self._class_name = type(self).__name__
         self._logger = (logger or self._build_logger())
+        self._refresh_log_levels()
 
         self.monitor_ses_reputation = monitor_ses_reputation
         self.monitor_ses_sending_quota = monitor_ses_sending_quota
         self.ses_management_strategy = (ses_management_strategy or SES_MONITOR_STRATEGY)
-        self.ses_service = (ses_service or SesService(client=ses_client))
-        self.cloudwatch_service = (cloudwatch_service or CloudWatchService(client=cloudwatch_client))
-        self.pager_duty_service = (pager_duty_service or PagerDutyService(logger=logger))
-        self.slack_service = (slack_service or SlackService(logger=logger))
+        self._ses_client = ses_client
+        self._ses_service = ses_service
+        self._cloudwatch_client = cloudwatch_client
+        self._cloudwatch_service = cloudwatch_service
+        self._pager_duty_service = pager_duty_service
+        self._slack_service = slack_service
+        self._service_logger = logger
+
+        self._invocation_timestamps = None
+        self._notify_pager_duty = (self._notify_config.notify_pager_duty_on_ses_reputation or
+                                   self._notify_config.notify_pager_duty_on_ses_sending_quota)
+        self._notify_slack = (self._notify_config.notify_slack_on_ses_reputation or
+                              self._notify_config.notify_slack_on_ses_sending_quota)
+        self._notify_ses_reputation = (self._notify_config.notify_pager_duty_on_ses_reputation or
+                                       self._notify_config.notify_slack_on_ses_reputation)
+        self._notify_ses_sending_quota = (self._notify_config.notify_pager_duty_on_ses_sending_quota or
+                                          self._notify_config.notify_slack_on_ses_sending_quota)
+        self._ses_sending_quota_levels = (
+            (self.ses_sending_quota_critical_percent, THRESHOLD_CRITICAL, self.ses_sending_quota_critical_percent),
+            (self.ses_sending_quota_warning_percent, THRESHOLD_WARNING, self.ses_sending_quota_warning_percent),
+            (float('-inf'), THRESHOLD_OK, self.ses_sending_quota_warning_percent))
 
     @property
     def ses_sending_quota_warning_percent(self):
@@ -119,6 +185,67 @@ class Monitor(object):
         '''
         return self._thresholds['ses_sending_quota_critical_percent']
 
+    @property
+    def ses_management_strategy(self):
+        '''
+        str: SES management strategy. Ex: managed, alert.
+        '''
+        return self._ses_management_strategy
+
+    @ses_management_strategy.setter
+    def ses_management_strategy(self, ses_management_strategy):
+        self._ses_management_strategy = ses_management_strategy
+        self._is_managed = (ses_management_strategy == SES_MONITOR_STRATEGY_MANAGED)
+        self._is_valid_strategy = (ses_management_strategy in SES_MONITOR_STRATEGIES)
+
+    @property
+    def ses_service(self):
+        '''
+        obj (SesService): SES service instance, built on first access if one was not provided.
+        '''
+        if self._ses_service is None:
+            from ses_account_monitor.services.ses_service import SesService
+
+            self._ses_service = SesService(client=self._ses_client)
+
+        return self._ses_service
+
+    @property
+    def cloudwatch_service(self):
+        '''
+        obj (CloudWatchService): CloudWatch service instance, built on first access if one was not provided.
+        '''
+        if self._cloudwatch_service is None:
+            from ses_account_monitor.services.cloudwatch_service import CloudWatchService
+
+            self._cloudwatch_service = CloudWatchService(client=self._cloudwatch_client)
+
+        return self._cloudwatch_service
+
+    @property
+    def pager_duty_service(self):
+        '''
+        obj (PagerDutyService): PagerDuty service instance, built on first access if one was not provided.
+        '''
+        if self._pager_duty_service is None:
+            from ses_account_monitor.services.pager_duty_service import PagerDutyService
+
+            self._pager_duty_service = PagerDutyService(logger=self._service_logger)
+
+        return self._pager_duty_service
+
+    @property
+    def slack_service(self):
+        '''
+        obj (SlackService): Slack service instance, built on first access if one was not provided.
+        '''
+        if self._slack_service is None:
+            from ses_account_monitor.services.slack_service import SlackService
+
+            self._slack_service = SlackService(logger=self._service_logger)
+
+        return self._slack_service
+
     @property
     def logger(self):
         '''
@@ -133,9 +260,74 @@ class Monitor(object):
         '''
         return self._notify_config
 
+    def reset(self):
+        '''
+        Clears pending notifications, notification responses and the cached SES account sending state,
+        so the instance can be reused across invocations. The cached log level flags are refreshed.
+
+        Returns:
+            self (Monitor): Monitor instance.
+        '''
+
+        self._refresh_log_levels()
+        self.logger.debug('Resetting pending notifications and responses...')
+
+        if self._pager_duty_service is not None:
+            self._pager_duty_service.events.clear()
+            self._pager_duty_service.responses = []
+
+        if self._slack_service is not None:
+            self._slack_service.messages.clear()
+            self._slack_service.responses = []
+
+        if self._ses_service is not None:
+            self._ses_service.clear_account_sending_enabled_cache()
+        self._invocation_timestamps = None
+
+        return self
+
+    def begin_invocation(self, target_datetime=None):
+        '''
+        Resets the instance and captures the invocation timestamps, so handle_ses_sending_quota and handle_ses_reputation
+        share them instead of each computing their own.
+
+        Args:
+            target_datetime (datetime.datetime): Datetime object. Default is None, if not set will use the current datetime.
+
+        Returns:
+            self (Monitor): Monitor instance.
+        '''
+
+        self.reset()
+        self._invocation_timestamps = self._build_timestamps(target_datetime)
+
+        return self
+
+    def prewarm_clients(self):
+        '''
+        Builds the AWS clients for the enabled monitors ahead of the first invocation, and makes a SES GetSendQuota call
+        to resolve credentials and open the connection. Failures are logged and ignored, the invocation will retry them.
+
+        Returns:
+            self (Monitor): Monitor instance.
+        '''
+
+        self.logger.debug('Prewarming AWS clients...')
+
+        if self.monitor_ses_reputation:
+            self.cloudwatch_service.prewarm()
+
+        if self.monitor_ses_reputation or self.monitor_ses_sending_quota:
+            try:
+                self.ses_service.get_account_sending_quota()
+            except Exception as e:
+                self.logger.warning('Prewarming the SES client failed: %s', e)
+
+        return self
+
     def send_notifications(self, raise_on_errors=False):
         '''
-        Send all notifications.
+        Send all notifications, services with every notify flag disabled in the notify config are skipped.
 
         Args:
             raise_on_errors (:obj:`bool`, optional): Flag to raise exceptions on notification failures.
@@ -146,15 +338,44 @@ class Monitor(object):
             dict: Object containing the notification responses from PagerDuty and Slack.
                 pager_duty (:obj:`list` of :obj:`tuple`): List of tuples containing the event id and response.
                     event_id (str): PagerDuty event id.
-                    response (requests.Response/dict): Response object. If a dry run was executed will be a dict of the request params.
+                    response (HttpResponse/dict): Response object. If a dry run was executed will be a dict of the request params.
                 slack (:obj:`list` of :obj:`tuple`): List of tuples containing the channel and response.
                     channel (str): Slack channel.
-                    response (requests.Response/dict): Response object. If a dry run was executed will be a dict of the request params.
+                    response (HttpResponse/dict): Response object. If a dry run was executed will be a dict of the request params.
+
+        Raises:
+            NotificationFailure: When a service raises while sending, after every service has finished.
+                The exceptions from all services are included in its errors.
         '''
 
         self.logger.debug('Sending notifications...')
-        self.pager_duty_service.send_notifications()
-        self.slack_service.send_notifications()
+
+        services = []
+
+        if self._notify_pager_duty:
+            services.append(('PagerDuty', self.pager_duty_service))
+        else:
+            self.logger.debug('PagerDuty notifications are DISABLED, skipping...')
+
+        if self._notify_slack:
+            services.append(('Slack', self.slack_service))
+        else:
+            self.logger.debug('Slack notifications are DISABLED, skipping...')
+
+        futures = [(service_name, NOTIFICATION_EXECUTOR.submit(service.send_notifications))
+                   for service_name, service in services]
+
+        wait([future for service_name, future in futures])
+
+        errors = [(service_name, future.exception())
+                  for service_name, future in futures
+                  if future.exception() is not None]
+
+        if errors:
+            raise NotificationFailure('; '.join(f'Failed to send {service_name} notifications: {error!r}'
+                                                for service_name, error in errors),
+                                      errors=errors) from errors[0][1]
+
         self.logger.debug('Finished sending all notifications!')
 
         if raise_on_errors:
@@ -174,46 +395,38 @@ class Monitor(object):
                 pager_duty (collections.deque): Pager Duty events queue.
                 slack (collections.deque): Slack messages queue.
 
-            A empty dict will be returned if SES account sending quota monitoring is disabled or if the strategy is not a valid one.
+            A empty dict will be returned if SES account sending quota monitoring is disabled, if the strategy is not a valid one
+            or if PagerDuty and Slack notifications are both disabled for the SES sending quota.
         '''
 
         if not self.monitor_ses_sending_quota:
-            self.logger.debug('Handling SES account sending quota is DISABLED, skipping...')
+            if self._dbg:
+                self.logger.debug('Handling SES account sending quota is DISABLED, skipping...')
             return {}
 
-        self.logger.debug('Handling SES account sending quota...')
+        if self._dbg:
+            self.logger.debug('Handling SES account sending quota...')
 
-        if (self.ses_management_strategy != SES_MONITOR_STRATEGY_MANAGED) and (self.ses_management_strategy != SES_MONITOR_STRATEGY_ALERT):
-            self.logger.debug('SES management strategy %s is not VALID, skipping!', self.ses_management_strategy)
+        if not self._is_valid_strategy:
+            if self._dbg:
+                self.logger.debug('SES management strategy %s is not VALID, skipping!', self.ses_management_strategy)
             return {}
 
-        target_datetime = (target_datetime or current_datetime())
-        event_iso_ts = iso8601_timestamp(target_datetime)
-        event_unix_ts = unix_timestamp(target_datetime)
-
-        volume, max_volume, utilization_percent, metric_iso_ts = self.ses_service.get_account_sending_stats(event_iso_ts=event_iso_ts)
-
-        critical_percent = self.ses_sending_quota_critical_percent
-        warning_percent = self.ses_sending_quota_warning_percent
-
-        if utilization_percent >= critical_percent:
-            self._handle_ses_sending_quota_critical(utilization_percent=utilization_percent,
-                                                    critical_percent=critical_percent,
-                                                    volume=volume,
-                                                    max_volume=max_volume,
-                                                    metric_iso_ts=metric_iso_ts,
-                                                    event_iso_ts=event_iso_ts,
-                                                    event_unix_ts=event_unix_ts)
-        elif utilization_percent >= warning_percent:
-            self._handle_ses_sending_quota_warning(utilization_percent=utilization_percent,
-                                                   warning_percent=warning_percent,
-                                                   volume=volume,
-                                                   max_volume=max_volume,
-                                                   metric_iso_ts=metric_iso_ts,
-                                                   event_unix_ts=event_unix_ts)
-        else:
-            self._handle_ses_sending_quota_ok(utilization_percent=utilization_percent,
-                                              warning_percent=warning_percent)
+        if not self._notify_ses_sending_quota:
+            if self._dbg:
+                self.logger.debug('SES sending quota notifications are DISABLED, skipping...')
+            return {}
+
+        target_datetime, event_iso_ts, event_unix_ts = self._get_timestamps(target_datetime)
+
+        stats = self.ses_service.get_account_sending_stats(event_iso_ts=event_iso_ts)
+        utilization_percent = stats.utilization_percent
+
+        for min_percent, threshold_name, threshold_percent in self._ses_sending_quota_levels:
+            if utilization_percent >= min_percent:
+                break
+
+        self._handle_ses_sending_quota_status(threshold_name, threshold_percent, stats, event_iso_ts, event_unix_ts)
 
         return self._get_pending_notifications()
 
@@ -229,22 +442,29 @@ class Monitor(object):
                 pager_duty (collections.deque): Pager Duty events queue.
                 slack (collections.deque): Slack messages queue.
 
-            A empty dict will be returned if SES account sending quota monitoring is disabled or if the strategy is not a valid one.
+            A empty dict will be returned if SES account reputation monitoring is disabled, if the strategy is not a valid one
+            or if the strategy is not managed and PagerDuty and Slack notifications are both disabled for the SES reputation.
         '''
 
-        self.logger.debug('Handling SES account reputation...')
-
         if not self.monitor_ses_reputation:
-            self.logger.debug('SES reputation is DISABLED, skipping...')
+            if self._dbg:
+                self.logger.debug('SES reputation is DISABLED, skipping...')
             return {}
 
-        if (self.ses_management_strategy != SES_MONITOR_STRATEGY_MANAGED) and (self.ses_management_strategy != SES_MONITOR_STRATEGY_ALERT):
-            self.logger.debug('SES management strategy %s is not VALID, skipping!', self.ses_management_strategy)
+        if self._dbg:
+            self.logger.debug('Handling SES account reputation...')
+
+        if not self._is_valid_strategy:
+            if self._dbg:
+                self.logger.debug('SES management strategy %s is not VALID, skipping!', self.ses_management_strategy)
             return {}
 
-        target_datetime = (target_datetime or current_datetime())
-        event_iso_ts = iso8601_timestamp(target_datetime)
-        event_unix_ts = unix_timestamp(target_datetime)
+        if not (self._notify_ses_reputation or self._is_managed):
+            if self._dbg:
+                self.logger.debug('SES reputation notifications are DISABLED and SES is not managed, skipping...')
+            return {}
+
+        target_datetime, event_iso_ts, event_unix_ts = self._get_timestamps(target_datetime)
 
         metrics = self.cloudwatch_service.get_ses_account_reputation_metrics(target_datetime=target_datetime,
                                                                              period=period,
@@ -260,6 +480,17 @@ class Monitor(object):
         elif metrics.ok:
             self._handle_ses_reputation_ok(metrics=metrics,
                                            event_unix_ts=event_unix_ts)
+        else:
+            if self._dbg:
+                self.logger.debug('SES account reputation has no metrics, skipping...')
+            return self._get_pending_notifications()
+
+        if self._dbg:
+            self.logger.debug('SES account reputation handler complete.')
+
+        if self._info:
+            self.logger.info(json_dump_response_event(class_name=self._class_name,
+                                                      method_name='handle_ses_reputation'))
 
         return self._get_pending_notifications()
 
@@ -272,9 +503,53 @@ class Monitor(object):
         '''
 
         logger = logging.getLogger(self.__module__)
-        logger.addHandler(logging.NullHandler())
+
+        if not logger.handlers:
+            logger.addHandler(logging.NullHandler())
+
         return logger
 
+    def _refresh_log_levels(self):
+        '''
+        Caches whether the logger has DEBUG and INFO enabled, so the handlers check a flag instead of the logger.
+        '''
+
+        self._dbg = self._logger.isEnabledFor(logging.DEBUG)
+        self._info = self._logger.isEnabledFor(logging.INFO)
+
+    def _build_timestamps(self, target_datetime=None):
+        '''
+        Builds the event timestamps.
+
+        Args:
+            target_datetime (datetime.datetime): Datetime object. Default is None, if not set will use the current datetime.
+
+        Returns:
+            tuple:
+                target_datetime (datetime.datetime): The target datetime.
+                event_iso_ts (str): ISO 8601 timestamp.
+                event_unix_ts (int): UNIX timestamp.
+        '''
+
+        target_datetime = (target_datetime or current_datetime())
+        return (target_datetime, iso8601_timestamp(target_datetime), unix_timestamp(target_datetime))
+
+    def _get_timestamps(self, target_datetime=None):
+        '''
+        Gets the event timestamps, reusing the invocation timestamps when a target datetime is not provided.
+
+        Args:
+            target_datetime (datetime.datetime): Datetime object. Default is None.
+
+        Returns:
+            tuple: See _build_timestamps.
+        '''
+
+        if (target_datetime is None) and (self._invocation_timestamps is not None):
+            return self._invocation_timestamps
+
+        return self._build_timestamps(target_datetime)
+
     def _get_pending_notifications(self):
         '''
         Gets the notification queues for PagerDuty and Slack.
@@ -283,11 +558,16 @@ class Monitor(object):
             dict: Queued notifications for PagerDuty and Slack.
                 pager_duty (collections.deque): Pager Duty events queue.
                 slack (collections.deque): Slack messages queue.
+
+            Services that have not been built yet return a empty queue, they are not built to read it.
         '''
 
+        slack_service = self._slack_service
+        pager_duty_service = self._pager_duty_service
+
         return {
-            'slack': self.slack_service.messages,
-            'pager_duty': self.pager_duty_service.events
+            'slack': slack_service.messages if slack_service is not None else deque(),
+            'pager_duty': pager_duty_service.events if pager_duty_service is not None else deque()
         }
 
     def _get_notification_responses(self):
@@ -298,136 +578,88 @@ class Monitor(object):
             dict: Object containing the notification responses from PagerDuty and Slack.
                 pager_duty (:obj:`list` of :obj:`tuple`): List of tuples containing the event id and response.
                     event_id (str): PagerDuty event id.
-                    response (requests.Response/dict): Response object. If a dry run was executed will be a dict of the request params.
+                    response (HttpResponse/dict): Response object. If a dry run was executed will be a dict of the request params.
                 slack (:obj:`list` of :obj:`tuple`): List of tuples containing the channel and response.
                     channel (str): Slack channel.
-                    response (requests.Response/dict): Response object. If a dry run was executed will be a dict of the request params.
+                    response (HttpResponse/dict): Response object. If a dry run was executed will be a dict of the request params.
+
+            Services that have not been built yet return a empty list, they are not built to read it.
         '''
 
+        slack_service = self._slack_service
+        pager_duty_service = self._pager_duty_service
+
         return {
-            'slack': self.slack_service.responses,
-            'pager_duty': self.pager_duty_service.responses
+            'slack': slack_service.responses if slack_service is not None else [],
+            'pager_duty': pager_duty_service.responses if pager_duty_service is not None else []
         }
 
-    def _handle_ses_sending_quota_critical(self,
-                                           utilization_percent,
-                                           critical_percent,
-                                           volume,
-                                           max_volume,
-                                           metric_iso_ts,
-                                           event_iso_ts=None,
-                                           event_unix_ts=None):
+    def _handle_ses_sending_quota_status(self,
+                                         threshold_name,
+                                         threshold_percent,
+                                         stats,
+                                         event_iso_ts=None,
+                                         event_unix_ts=None):
         '''
-        Actions taken when SES sending quota is in a CRITICAL state.
+        Actions taken for the SES sending quota state. CRITICAL triggers a PagerDuty event, WARNING and OK resolve it.
+        CRITICAL and WARNING queue a Slack message.
 
         Args:
-            utilization_percent (float/int): Utilization percentage. 80% is 80.
-            critical_percent (float/int): Critical threshold percentage. 80% is 80.
-            volume (float/int): Number of emails sent.
-            max_volume (float/int): Max number of emails allowed to be sent.
-            metric_iso_ts (str): ISO 8601 timestamp.
+            threshold_name (str): The SES sending quota state. Ex: CRITICAL, WARNING, OK.
+            threshold_percent (float/int): Threshold percentage for the state. 80% is 80.
+            stats (SesSendingStats): The SES account sending stats.
             event_iso_ts (:obj:`str`, optional): ISO 8601 timestamp.
                 Default is None, if not set will use current time.
             event_unix_ts (:obj:`str/int`, optional): UNIX timestamp.
                 Default is None, if not set will use current time.
         '''
 
-        self.logger.debug('SES sending quota is in a CRITICAL state!')
-        self._log_handle_ses_quota_request(utilization_percent, critical_percent, 'CRITICAL')
+        notify_config = self.notify_config
+        utilization_percent = stats.utilization_percent
 
-        if self.notify_config.notify_pager_duty_on_ses_sending_quota:
-            self.logger.debug('PagerDuty alerting is ENABLED, queuing TRIGGER event...')
-            self.pager_duty_service.enqueue_ses_account_sending_quota_trigger_event(volume=volume,
-                                                                                    max_volume=max_volume,
-                                                                                    utilization_percent=utilization_percent,
-                                                                                    threshold_percent=critical_percent,
-                                                                                    metric_ts=metric_iso_ts,
-                                                                                    event_iso_ts=event_iso_ts)
-        else:
-            self.logger.debug('PagerDuty alerting is DISABLED, skipping...')
+        if self._dbg:
+            self.logger.debug('SES sending quota is in a %s state!', threshold_name)
 
-        if self.notify_config.notify_slack_on_ses_sending_quota:
-            self.logger.debug('Slack notifications is ENABLED, queuing message...')
+        self._log_handle_ses_quota_request(utilization_percent, threshold_percent, threshold_name)
 
-            self.slack_service.enqueue_ses_account_sending_quota_message(threshold_name=THRESHOLD_CRITICAL,
-                                                                         utilization_percent=utilization_percent,
-                                                                         threshold_percent=critical_percent,
-                                                                         volume=volume,
-                                                                         max_volume=max_volume,
-                                                                         metric_iso_ts=metric_iso_ts,
-                                                                         event_unix_ts=event_unix_ts)
+        if not notify_config.notify_pager_duty_on_ses_sending_quota:
+            if self._dbg:
+                self.logger.debug('PagerDuty alerting is DISABLED, skipping...')
+        elif threshold_name == THRESHOLD_CRITICAL:
+            if self._dbg:
+                self.logger.debug('PagerDuty alerting is ENABLED, queuing TRIGGER event...')
+            self.pager_duty_service.enqueue_ses_account_sending_quota_trigger_event(volume=stats.volume,
+                                                                                    max_volume=stats.max_volume,
+                                                                                    utilization_percent=utilization_percent,
+                                                                                    threshold_percent=threshold_percent,
+                                                                                    metric_ts=stats.metric_iso_ts,
+                                                                                    event_iso_ts=event_iso_ts)
         else:
-            self.logger.debug('Slack notifications is DISABLED, skipping...')
-
-        self._log_handle_ses_quota_response()
-
-    def _handle_ses_sending_quota_warning(self,
-                                          utilization_percent,
-                                          warning_percent,
-                                          volume,
-                                          max_volume,
-                                          metric_iso_ts,
-                                          event_unix_ts=None):
-        '''
-        Actions taken when SES sending quota is in a WARNING state.
-
-        Args:
-            utilization_percent (float/int): Utilization percentage. 80% is 80.
-            warning_percent (float/int): Warning threshold percentage. 80% is 80.
-            volume (float/int): Number of emails sent.
-            max_volume (float/int): Max number of emails allowed to be sent.
-            metric_iso_ts (str): ISO 8601 timestamp.
-            event_unix_ts (:obj:`str/int`, optional): UNIX timestamp.
-                Default is None, if not set will use current time.
-            event_iso_ts (:obj:`str`, optional): ISO 8601 timestamp.
-                Default is None, if not set will use current time.
-        '''
-
-        self.logger.debug('SES sending quota is in a WARNING state!')
-
-        self._log_handle_ses_quota_request(utilization_percent, warning_percent, 'WARNING')
-
-        if self.notify_config.notify_pager_duty_on_ses_sending_quota:
-            self.logger.debug('PagerDuty alerting is ENABLED, queuing RESOLVE event...')
+            if self._dbg:
+                self.logger.debug('PagerDuty alerting is ENABLED, queuing RESOLVE event...')
             self.pager_duty_service.enqueue_ses_account_sending_quota_resolve_event()
-        else:
-            self.logger.debug('PagerDuty alerting is DISABLED, skipping...')
-
-        if self.notify_config.notify_slack_on_ses_sending_quota:
-            self.logger.debug('Slack notifications is ENABLED, queuing message...')
 
-            self.slack_service.enqueue_ses_account_sending_quota_message(threshold_name=THRESHOLD_WARNING,
-                                                                         utilization_percent=utilization_percent,
-                                                                         threshold_percent=warning_percent,
-                                                                         volume=volume,
-                                                                         max_volume=max_volume,
-                                                                         metric_iso_ts=metric_iso_ts,
-                                                                         event_unix_ts=event_unix_ts)
-        else:
-            self.logger.debug('Slack notifications is DISABLED, skipping...')
-
-        self._log_handle_ses_quota_response()
-
-    def _handle_ses_sending_quota_ok(self, utilization_percent, warning_percent):
-        '''
-        Actions taken when SES sending quota is in a OK state.
-
-        Args:
-            utilization_percent (float/int): Utilization percentage. 80% is 80.
-            warning_percent (float/int): Warning threshold percentage. 80% is 80.
-        '''
-
-        self.logger.debug('SES sending quota is in a OK state!')
+        if threshold_name != THRESHOLD_OK:
+            if notify_config.notify_slack_on_ses_sending_quota:
+                if self._dbg:
+                    self.logger.debug('Slack notifications is ENABLED, queuing message...')
 
-        self._log_handle_ses_quota_request(utilization_percent, warning_percent, 'OK')
+                self.slack_service.enqueue_ses_account_sending_quota_message(threshold_name=threshold_name,
+                                                                             utilization_percent=utilization_percent,
+                                                                             threshold_percent=threshold_percent,
+                                                                             volume=stats.volume,
+                                                                             max_volume=stats.max_volume,
+                                                                             metric_iso_ts=stats.metric_iso_ts,
+                                                                             event_unix_ts=event_unix_ts)
+            elif self._dbg:
+                self.logger.debug('Slack notifications is DISABLED, skipping...')
 
-        if self.notify_config.notify_pager_duty_on_ses_sending_quota:
-            self.logger.debug('PagerDuty alerting is ENABLED, queuing RESOLVE event...')
-            self.pager_duty_service.enqueue_ses_account_sending_quota_resolve_event()
-        else:
-            self.logger.debug('PagerDuty alerting is DISABLED, skipping...')
+        if self._dbg:
+            self.logger.debug('SES account sending handler complete.')
 
-        self._log_handle_ses_quota_response()
+        if self._info:
+            self.logger.info(json_dump_response_event(class_name=self._class_name,
+                                                      method_name='handle_ses_quota'))
 
     def _handle_ses_reputation_critical(self, metrics, event_iso_ts=None, event_unix_ts=None):
         '''
@@ -441,42 +673,49 @@ class Monitor(object):
                 Default is None, which will cause the current time to be used.
         '''
 
-        self.logger.debug('SES account reputation has metrics in a %s state!', THRESHOLD_CRITICAL)
+        if self._dbg:
+            self.logger.debug('SES account reputation has metrics in a %s state!', THRESHOLD_CRITICAL)
 
         self._log_handle_ses_reputation_request(metrics=metrics,
                                                 status=THRESHOLD_CRITICAL)
 
-        danger_metrics = (metrics.critical + metrics.warning)
+        notify_config = self.notify_config
+        danger_metrics = tuple(chain(metrics.critical, metrics.warning))
         action = ACTION_ALERT
 
-        if self.ses_management_strategy == SES_MONITOR_STRATEGY_MANAGED:
-            self.logger.debug('SES management strategy is %s, status is %s, DISABLING...', SES_MONITOR_STRATEGY_MANAGED, THRESHOLD_CRITICAL)
+        if self._is_managed:
+            if self._dbg:
+                self.logger.debug('SES management strategy is %s, status is %s, DISABLING...',
+                                  SES_MONITOR_STRATEGY_MANAGED,
+                                  THRESHOLD_CRITICAL)
             self.ses_service.disable_account_sending()
             action = ACTION_DISABLE
-        else:
-            self.logger.debug('SES management strategy is %s, status is %s, skipping...', SES_MONITOR_STRATEGY_MANAGED, THRESHOLD_CRITICAL)
-
-        if self.notify_config.notify_pager_duty_on_ses_reputation:
-            self.logger.debug('PagerDuty alerting is ENABLED, queuing TRIGGER event...')
+        elif self._dbg:
+            self.logger.debug('SES management strategy is %s, status is %s, skipping...',
+                              SES_MONITOR_STRATEGY_MANAGED,
+                              THRESHOLD_CRITICAL)
+
+        if notify_config.notify_pager_duty_on_ses_reputation:
+            if self._dbg:
+                self.logger.debug('PagerDuty alerting is ENABLED, queuing TRIGGER event...')
             self.pager_duty_service.enqueue_ses_account_reputation_trigger_event(metrics=danger_metrics,
                                                                                  event_iso_ts=event_iso_ts,
                                                                                  event_unix_ts=event_unix_ts,
                                                                                  action=action)
-        else:
+        elif self._dbg:
             self.logger.debug('PagerDuty alerting is DISABLED, skipping...')
 
-        if self.notify_config.notify_slack_on_ses_reputation:
-            self.logger.debug('Slack notifications is ENABLED, queuing message...')
+        if notify_config.notify_slack_on_ses_reputation:
+            if self._dbg:
+                self.logger.debug('Slack notifications is ENABLED, queuing message...')
 
             self.slack_service.enqueue_ses_account_reputation_message(threshold_name=THRESHOLD_CRITICAL,
                                                                       metrics=danger_metrics,
                                                                       event_unix_ts=event_unix_ts,
                                                                       action=action)
-        else:
+        elif self._dbg:
             self.logger.debug('Slack notifications is DISABLED, skipping...')
 
-        self._log_handle_ses_reputation_response()
-
     def _handle_ses_reputation_warning(self, metrics, event_unix_ts=None):
         '''
         Actions taken when SES account reputation is in a WARNING state.
@@ -489,34 +728,40 @@ class Monitor(object):
 
         action = ACTION_ALERT
 
-        self.logger.debug('SES account reputation has metrics in a %s state!', THRESHOLD_WARNING)
+        if self._dbg:
+            self.logger.debug('SES account reputation has metrics in a %s state!', THRESHOLD_WARNING)
 
         self._log_handle_ses_reputation_request(metrics=metrics,
                                                 status=THRESHOLD_WARNING)
 
-        if self.ses_management_strategy == SES_MONITOR_STRATEGY_MANAGED:
-            self.logger.debug('SES management strategy is %s, status is %s, ENABLING...', SES_MONITOR_STRATEGY_MANAGED, THRESHOLD_WARNING)
+        if self._is_managed:
+            if self._dbg:
+                self.logger.debug('SES management strategy is %s, status is %s, ENABLING...',
+                                  SES_MONITOR_STRATEGY_MANAGED,
+                                  THRESHOLD_WARNING)
 
             if not self.ses_service.is_account_sending_enabled():
-                self.logger.debug('SES account sending is currently DISABLED! ENABLING...')
+                if self._dbg:
+                    self.logger.debug('SES account sending is currently DISABLED! ENABLING...')
                 self.ses_service.enable_account_sending()
 
                 action = ACTION_ENABLE
-        else:
-            self.logger.debug('SES management strategy is %s, status is %s, skipping...', SES_MONITOR_STRATEGY_MANAGED, THRESHOLD_CRITICAL)
+        elif self._dbg:
+            self.logger.debug('SES management strategy is %s, status is %s, skipping...',
+                              SES_MONITOR_STRATEGY_MANAGED,
+                              THRESHOLD_CRITICAL)
 
         if self.notify_config.notify_slack_on_ses_reputation:
-            self.logger.debug('Slack notifications is ENABLED, queuing message...')
+            if self._dbg:
+                self.logger.debug('Slack notifications is ENABLED, queuing message...')
 
             self.slack_service.enqueue_ses_account_reputation_message(threshold_name=THRESHOLD_WARNING,
                                                                       metrics=metrics.warning,
                                                                       event_unix_ts=event_unix_ts,
                                                                       action=action)
-        else:
+        elif self._dbg:
             self.logger.debug('Slack notifications is DISABLED, skipping...')
 
-        self._log_handle_ses_reputation_response()
-
     def _handle_ses_reputation_ok(self, metrics, event_unix_ts=None):
         '''
         Actions taken when SES account reputation is in a CRITICAL state.
@@ -527,64 +772,91 @@ class Monitor(object):
                 Default is None, which will cause the current time to be used.
         '''
 
-        self.logger.debug('SES account reputation has metrics in a %s state!', THRESHOLD_OK)
+        if self._dbg:
+            self.logger.debug('SES account reputation has metrics in a %s state!', THRESHOLD_OK)
 
         self._log_handle_ses_reputation_request(metrics=metrics,
                                                 status=THRESHOLD_OK)
 
-        if self.ses_management_strategy == SES_MONITOR_STRATEGY_MANAGED:
-            self.logger.debug('SES management strategy is %s, status is %s, ENABLING...', SES_MONITOR_STRATEGY_MANAGED, THRESHOLD_OK)
+        if self._is_managed:
+            if self._dbg:
+                self.logger.debug('SES management strategy is %s, status is %s, ENABLING...',
+                                  SES_MONITOR_STRATEGY_MANAGED,
+                                  THRESHOLD_OK)
 
             if not self.ses_service.is_account_sending_enabled():
-                self.logger.debug('SES account sending is currently DISABLED! ENABLING...')
+                if self._dbg:
+                    self.logger.debug('SES account sending is currently DISABLED! ENABLING...')
                 self.ses_service.enable_account_sending()
 
                 if self.notify_config.notify_slack_on_ses_reputation:
-                    self.logger.debug('Slack notifications is ENABLED, queuing message...')
+                    if self._dbg:
+                        self.logger.debug('Slack notifications is ENABLED, queuing message...')
 
                     self.slack_service.enqueue_ses_account_reputation_message(threshold_name=THRESHOLD_WARNING,
                                                                               metrics=metrics.warning,
                                                                               event_unix_ts=event_unix_ts,
                                                                               action=ACTION_ENABLE)
-                else:
+                elif self._dbg:
                     self.logger.debug('Slack notifications is DISABLED, skipping...')
 
-        else:
-            self.logger.debug('SES management strategy is %s, status is %s, skipping...', SES_MONITOR_STRATEGY_MANAGED, THRESHOLD_OK)
-
-        self._log_handle_ses_reputation_response()
+        elif self._dbg:
+            self.logger.debug('SES management strategy is %s, status is %s, skipping...',
+                              SES_MONITOR_STRATEGY_MANAGED,
+                              THRESHOLD_OK)
 
     def _handle_notification_responses(self):
         '''
-        Review notification responses returned 4XX-5XX responses.
+        Review notification responses returned 4XX-5XX responses. Every response is reviewed before raising,
+        so a single exception reports the failures from both PagerDuty and Slack.
 
         Raises:
             NotificationFailure: When a notification HTTP response is within the 4XX-5XX range.
         '''
 
-        if self.pager_duty_service.dry_run:
-            self.logger.debug('PagerDuty service DRY RUN is ENABLED, skipping notification checks...')
-        else:
-            self.logger.debug('Reviewing PagerDuty notification responses...')
+        failures = list(self._iter_notification_failures())
 
-            for eid, r in self.pager_duty_service.responses:
-                if (r.status_code >= 400) and (r.status_code <= 500):
-                    self.logger.debug('PagerDuty notification FAILURE for event: %s, received: %s.', eid, r.status_code)
-                    raise NotificationFailure('Failed to post event to PagerDuty: {event}, status: {status}'.format(event=eid,
-                                                                                                                    status=r.status_code))
+        if failures:
+            raise NotificationFailure('; '.join(f'Failed to post to {service}: {key}, status: {status_code}'
+                                                for service, key, status_code in failures),
+                                      failures)
 
-        if self.slack_service.dry_run:
-            self.logger.debug('Slack service DRY RUN is ENABLED, skipping notification checks...')
-        else:
-            self.logger.debug('Reviewing Slack notification responses...')
+        self.logger.debug('Notifications were all sent successfully!')
 
-            for ch, r in self.slack_service.responses:
-                if (r.status_code >= 400) and (r.status_code <= 500):
-                    self.logger.debug('Slack notification FAILURE for channel: %s, received: %s.', ch, r.status_code)
-                    raise NotificationFailure('Failed to post to Slack channel: {channel}, status: {status}.'.format(channel=ch,
-                                                                                                                     status=r.status_code))
+    def _iter_notification_failures(self):
+        '''
+        Iterate over the notification responses within the 4XX-5XX range, services with DRY RUN enabled or that have not
+        been built yet are skipped.
 
-        self.logger.debug('Notifications were all sent successfully!')
+        Yields:
+            tuple:
+                service (str): The notification service. Ex: PagerDuty, Slack.
+                key (str): The PagerDuty event id or the Slack channel.
+                status_code (int): The HTTP status code.
+        '''
+
+        logger = self.logger
+        dbg = self._dbg
+
+        for service_name, service in (('PagerDuty', self._pager_duty_service), ('Slack', self._slack_service)):
+            if service is None:
+                continue
+
+            if service.dry_run:
+                if dbg:
+                    logger.debug('%s service DRY RUN is ENABLED, skipping notification checks...', service_name)
+                continue
+
+            if dbg:
+                logger.debug('Reviewing %s notification responses...', service_name)
+
+            for key, r in service.responses:
+                status_code = r.status_code
+
+                if 400 <= status_code < 600:
+                    if dbg:
+                        logger.debug('%s notification FAILURE for: %s, received: %s.', service_name, key, status_code)
+                    yield (service_name, key, status_code)
 
     def _log_handle_ses_quota_request(self, utilization_percent, threshold_percent, status):
         '''
@@ -596,61 +868,39 @@ class Monitor(object):
             status (str): The status of the SES account quota. Ex: CRITICAL, WARNING, OK.
         '''
 
-        self.logger.debug('SES account sending percentage is at %s, threshold is at %s, status is %s!',
-                          utilization_percent,
-                          threshold_percent,
-                          status)
+        if self._dbg:
+            self.logger.debug('SES account sending percentage is at %s, threshold is at %s, status is %s!',
+                              utilization_percent,
+                              threshold_percent,
+                              status)
 
-        self.logger.info(
-            json_dump_request_event(class_name=self.__class__.__name__,
-                                    method_name='handle_ses_quota',
-                                    details={
-                                        'utilization_percent': utilization_percent,
-                                        'threshold_percent': threshold_percent,
-                                        'status': status
-                                    }))
-
-    def _log_handle_ses_quota_response(self):
-        '''
-        Log the SES account quota handler response.
-        '''
-
-        self.logger.debug('SES account sending handler complete.')
-
-        self.logger.info(
-            json_dump_response_event(class_name=self.__class__.__name__,
-                                     method_name='handle_ses_quota'))
+        if self._info:
+            self.logger.info(
+                json_dump_request_event(class_name=self._class_name,
+                                        method_name='handle_ses_quota',
+                                        details={
+                                            'utilization_percent': utilization_percent,
+                                            'threshold_percent': threshold_percent,
+                                            'status': status
+                                        }))
 
     def _log_handle_ses_reputation_request(self, metrics, status):
         '''
         Log the SES account reputation handler request.
         '''
 
-        critical_count = len(metrics.critical)
-        warning_count = len(metrics.warning)
-        ok_count = len(metrics.ok)
-
-        self.logger.debug('SES account reputation metrics - critical: %s, warning: %s, ok: %s, status is %s!',
-                          critical_count,
-                          warning_count,
-                          ok_count,
-                          status)
-
-        self.logger.info(
-            json_dump_request_event(class_name=self.__class__.__name__,
-                                    method_name='handle_ses_reputation',
-                                    details={
-                                        'critical': metrics.critical,
-                                        'warning': metrics.warning,
-                                        'ok': metrics.ok}))
-
-    def _log_handle_ses_reputation_response(self):
-        '''
-        Log the SES account reputation handler response.
-        '''
-
-        self.logger.debug('SES account reputation handler complete.')
-
-        self.logger.info(
-            json_dump_response_event(class_name=self.__class__.__name__,
-                                     method_name='handle_ses_reputation'))
+        if self._dbg:
+            self.logger.debug('SES account reputation metrics - critical: %s, warning: %s, ok: %s, status is %s!',
+                              len(metrics.critical),
+                              len(metrics.warning),
+                              len(metrics.ok),
+                              status)
+
+        if self._info:
+            self.logger.info(
+                json_dump_request_event(class_name=self._class_name,
+                                        method_name='handle_ses_reputation',
+                                        details={
+                                            'critical': metrics.critical,
+                                            'warning': metrics.warning,
+                                            'ok': metrics.ok}))
@@ -17,10 +17,9 @@ from datetime import (
 
 from decimal import Decimal
 
-import boto3
+from ses_account_monitor.clients.aws_client import build_aws_client
 
 from ses_account_monitor.config import (
-    LAMBDA_AWS_SESSION_CONFIG,
     SES_REPUTATION_PERIOD,
     SES_REPUTATION_METRIC_TIMEDELTA,
     SES_THRESHOLDS,
@@ -45,31 +44,6 @@ Args:
 '''
 
 
-def build_client(session_config=None):
-    '''
-    Build a CloudWatch client, if a session config is provided, it will use it to create the client.
-
-    Args:
-        session_config (dict):
-            aws_access_key_id (str): AWS access key ID.
-            aws_secret_access_key (str): AWS secret access key.
-            aws_session_token (str): AWS temporary session token.
-            region_name (str): Default region when creating new connections.
-            botocore_session (botocore.session.Session): Use this Botocore session instead of creating a new default one.
-            profile_name (str): The name of a profile to use. If not given, then the default profile is used.
-
-    Returns:
-        obj (botocore.client.CloudWatch): The CloudWatch client.
-    '''
-
-    if session_config:
-        session = boto3.Session(**session_config)
-    else:
-        session = boto3.Session(**LAMBDA_AWS_SESSION_CONFIG)
-
-    return session.client('cloudwatch')
-
-
 def get_last_metric(metric):
     '''
     Get last metric from MetricDataResults.
@@ -99,6 +73,87 @@ def get_last_metric(metric):
     return (metric['Label'], last_value, last_ts.astimezone(timezone.utc).isoformat())
 
 
+def summarize_metric_data_response(response):
+    '''
+    Summarize a GetMetricData response for logging, keeping only the last datapoint of each metric.
+
+    Args:
+        response (dict): GetMetricData response.
+
+    Returns:
+        dict:
+            metrics (:obj:`list` of :obj:`tuple`): The last metric for each result, see get_last_metric.
+            request_id (str/NoneType): The AWS request id.
+    '''
+
+    return {
+        'metrics': [get_last_metric(metric) for metric in response['MetricDataResults']],
+        'request_id': response.get('ResponseMetadata', {}).get('RequestId')
+    }
+
+
+def build_metric_thresholds(ses_thresholds):
+    '''
+    Flattens the SES thresholds configuration into the critical and warning thresholds for each metric.
+
+    Args:
+        ses_thresholds (dict): SES thresholds configuration, keyed by the threshold name and then the metric id.
+
+    Returns:
+        dict: The thresholds keyed by the metric id.
+            metric_id (tuple):
+                critical_threshold (float): The critical threshold percentage.
+                warning_threshold (float): The warning threshold percentage.
+    '''
+
+    critical_thresholds = ses_thresholds[THRESHOLD_CRITICAL]
+    warning_thresholds = ses_thresholds[THRESHOLD_WARNING]
+
+    return {metric_id: (critical_thresholds[metric_id], warning_thresholds[metric_id])
+            for metric_id in critical_thresholds}
+
+
+def build_ses_reputation_metric_queries(period):
+    '''
+    Generates the MetricDataQueries to request SES account reputation metrics.
+
+    Args:
+        period (int): The amount of seconds for the measurement periods in CloudWatch.
+
+    Returns:
+        list (dict): List of dict objects, describing the metrics to collect.
+    '''
+
+    return [
+        {
+            'Id': 'bounce_rate',
+            'MetricStat': {
+                'Metric': {
+                    'Namespace': 'AWS/SES',
+                    'MetricName': 'Reputation.BounceRate'
+                },
+                'Period': period,
+                'Stat': 'Average'
+            },
+            'Label': 'Bounce Rate',
+            'ReturnData': True
+        },
+        {
+            'Id': 'complaint_rate',
+            'MetricStat': {
+                'Metric': {
+                    'Namespace': 'AWS/SES',
+                    'MetricName': 'Reputation.ComplaintRate'
+                },
+                'Period': period,
+                'Stat': 'Average'
+            },
+            'Label': 'Complaint Rate',
+            'ReturnData': True
+        }
+    ]
+
+
 class CloudWatchService(object):
     '''
     CloudWatch Service class, interfaces with CloudWatch.
@@ -121,19 +176,26 @@ class CloudWatchService(object):
             ses_reputation_metric_timedelta (:obj:`int`, optional): SES reputation metric timedelta in seconds.
         '''
 
-        self._client = (client or build_client(session_config))
+        self._client = client
+        self._session_config = session_config
         self._logger = (logger or self._build_logger())
 
         self.ses_thresholds = (ses_thresholds or SES_THRESHOLDS)
         self.ses_reputation_period = (ses_reputation_period or SES_REPUTATION_PERIOD)
         self.ses_reputation_metric_timedelta = (ses_reputation_metric_timedelta or SES_REPUTATION_METRIC_TIMEDELTA)
 
+        self._ses_reputation_metric_queries = (self.ses_reputation_period,
+                                               build_ses_reputation_metric_queries(self.ses_reputation_period))
+
     @property
     def client(self):
         '''
-        obj (botocore.client.CloudWatch): The CloudWatch client.
+        obj (botocore.client.CloudWatch): The CloudWatch client, built on first access if one was not provided.
         '''
 
+        if self._client is None:
+            self._client = build_aws_client('cloudwatch', self._session_config)
+
         return self._client
 
     @property
@@ -144,6 +206,32 @@ class CloudWatchService(object):
 
         return self._logger
 
+    @property
+    def ses_thresholds(self):
+        '''
+        dict: SES thresholds configuration, setting it also rebuilds the thresholds for each metric.
+        '''
+
+        return self._ses_thresholds
+
+    @ses_thresholds.setter
+    def ses_thresholds(self, ses_thresholds):
+        self._ses_thresholds = ses_thresholds
+        self._metric_thresholds = build_metric_thresholds(ses_thresholds)
+
+    def prewarm(self):
+        '''
+        Build the CloudWatch client ahead of the first request, if one was not provided.
+
+        Returns:
+            self (CloudWatchService): CloudWatchService instance.
+        '''
+
+        if self._client is None:
+            self._client = build_aws_client('cloudwatch', self._session_config)
+
+        return self
+
     def get_ses_account_reputation_metrics(self, target_datetime=None, period=None, metric_timedelta=None):
         '''
         Get SES account reputation metrics, fetches it from AWS and then returns the latest metrics in a standardized format.
@@ -222,6 +310,7 @@ class CloudWatchService(object):
         Returns:
             dict:
                 MetricDataQueries (:obj:`list` of :obj:`dict`): List of dict objects, describing the metrics to collect.
+                    Shared across calls for the configured period, it must not be mutated.
                 StartTime (datetime): The starting datetime for the metrics collection.
                 EndTime (datetime): The ending datetime for the metrics collection.
         '''
@@ -235,35 +324,13 @@ class CloudWatchService(object):
         if target_datetime is None:
             target_datetime = current_datetime()
 
+        cached_period, metric_queries = self._ses_reputation_metric_queries
+
+        if period != cached_period:
+            metric_queries = build_ses_reputation_metric_queries(period)
+
         return {
-            'MetricDataQueries': [
-                {
-                    'Id': 'bounce_rate',
-                    'MetricStat': {
-                        'Metric': {
-                            'Namespace': 'AWS/SES',
-                            'MetricName': 'Reputation.BounceRate'
-                        },
-                        'Period': period,
-                        'Stat': 'Average'
-                    },
-                    'Label': 'Bounce Rate',
-                    'ReturnData': True
-                },
-                {
-                    'Id': 'complaint_rate',
-                    'MetricStat': {
-                        'Metric': {
-                            'Namespace': 'AWS/SES',
-                            'MetricName': 'Reputation.ComplaintRate'
-                        },
-                        'Period': period,
-                        'Stat': 'Average'
-                    },
-                    'Label': 'Complaint Rate',
-                    'ReturnData': True
-                }
-            ],
+            'MetricDataQueries': metric_queries,
             'StartTime': target_datetime - timedelta(seconds=metric_timedelta),
             'EndTime': target_datetime
         }
@@ -281,7 +348,7 @@ class CloudWatchService(object):
                 [(label, value, threshold, iso8601_timestamp), ...]
         '''
 
-        thresholds = self.ses_thresholds
+        metric_thresholds = self._metric_thresholds
 
         results = SesReputationMetrics(critical=[],
                                        ok=[],
@@ -289,11 +356,10 @@ class CloudWatchService(object):
 
         for metric in metric_data:
             last_metric = get_last_metric(metric)
-            critical_threshold = thresholds[THRESHOLD_CRITICAL][metric['Id']]
-            warning_threshold = thresholds[THRESHOLD_WARNING][metric['Id']]
 
             if last_metric:
                 label, current_value, metric_ts = last_metric
+                critical_threshold, warning_threshold = metric_thresholds[metric['Id']]
 
                 if current_value >= critical_threshold:
                     results.critical.append((label, current_value, critical_threshold, metric_ts))
@@ -313,7 +379,10 @@ class CloudWatchService(object):
         '''
 
         logger = logging.getLogger(self.__module__)
-        logger.addHandler(logging.NullHandler())
+
+        if not logger.handlers:
+            logger.addHandler(logging.NullHandler())
+
         return logger
 
     def _log_get_ses_account_reputation_metrics_request(self, params):
@@ -326,14 +395,15 @@ class CloudWatchService(object):
 
         self.logger.debug('Requesting SES reputation metric data for account')
 
-        self.logger.info(
-            json_dump_request_event(class_name=self.__class__.__name__,
-                                    method_name='get_ses_account_reputation_metrics',
-                                    params=params))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                json_dump_request_event(class_name=self.__class__.__name__,
+                                        method_name='get_ses_account_reputation_metrics',
+                                        params=params))
 
     def _log_get_ses_account_reputation_metrics_response(self, response):
         '''
-        Log the response from getting SES account reputation metrics.
+        Log a summary of the response from getting SES account reputation metrics.
 
         Args:
             response (dict): MetricDataResults dict object.
@@ -341,7 +411,8 @@ class CloudWatchService(object):
 
         self.logger.debug('Received SES reputation metric data for account')
 
-        self.logger.info(
-            json_dump_response_event(class_name=self.__class__.__name__,
-                                     method_name='get_ses_account_reputation_metrics',
-                                     response=response))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                json_dump_response_event(class_name=self.__class__.__name__,
+                                         method_name='get_ses_account_reputation_metrics',
+                                         response=summarize_metric_data_response(response)))
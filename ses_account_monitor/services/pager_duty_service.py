@@ -94,7 +94,7 @@ class PagerDutyService(HttpClient):
                 send_status (bool): Returns True when notifications were actually sent, if False a dry run was executed.
                 responses (:obj:`list` of :obj:`tuple`):
                     event_id (str): A identifier made up of the PagerDuty event_key and event_action.
-                    responses (:obj:`list` of :obj:`requests.Response/dict`): List of response objects.
+                    responses (:obj:`list` of :obj:`HttpResponse/dict`): List of response objects.
                         If a dry run occurred, will return dict objects containing the params for the request.
         '''
 
@@ -10,10 +10,14 @@ SES service module.
 from __future__ import division
 
 import logging
+import time
 
-import boto3
+from collections import namedtuple
 
-from ses_account_monitor.config import LAMBDA_AWS_SESSION_CONFIG
+from ses_account_monitor.clients.aws_client import build_aws_client
+
+from ses_account_monitor.config import (
+    SES_SENDING_QUOTA_CACHE_TTL)
 
 from ses_account_monitor.util import (
     iso8601_timestamp,
@@ -22,28 +26,19 @@ from ses_account_monitor.util import (
     get_utilization_percentage)
 
 
-def build_client(session_config):
-    '''
-    Build a SES client, if a session config is provided, it will use it to create the client.
-
-    Args:
-        session_config (dict):
-            aws_access_key_id (str): AWS access key ID.
-            aws_secret_access_key (str): AWS secret access key.
-            aws_session_token (str): AWS temporary session token.
-            region_name (str): Default region when creating new connections.
-            botocore_session (botocore.session.Session): Use this Botocore session instead of creating a new default one.
-            profile_name (str): The name of a profile to use. If not given, then the default profile is used.
-
-    Returns:
-        obj (botocore.client.SES): The SES client.
-    '''
+SesSendingStats = namedtuple('SesSendingStats', ('volume',
+                                                 'max_volume',
+                                                 'utilization_percent',
+                                                 'metric_iso_ts'))
+'''
+class:SesSendingStats
 
-    if session_config:
-        session = boto3.Session(**session_config)
-    else:
-        session = boto3.Session(**LAMBDA_AWS_SESSION_CONFIG)
-    return session.client('ses')
+Args:
+    volume (float): The total number of emails sent.
+    max_volume (float): The max number of emails allowed to be sent.
+    utilization_percent (float): Percentage of max_volume being utilized, 80% is represented as 80.
+    metric_iso_ts (str): ISO 8601 formatted timestamp string.
+'''
 
 
 class SesService(object):
@@ -54,23 +49,37 @@ class SesService(object):
     def __init__(self,
                  client=None,
                  logger=None,
-                 session_config=None):
+                 session_config=None,
+                 quota_cache_ttl=None):
         '''
         Args:
             client (botocore.client.SES): The SES client.
             logger (:obj:`logging.Logger`, optional): Logger instance. Defaults to None, which will create a logger instance.
             session_config (:obj:`dict`, optional): The SES session, used to configure the client if the client is not provided.
+            quota_cache_ttl (:obj:`float/int`, optional): Seconds to reuse a fetched sending quota, 0 disables caching.
+                Defaults to None, which will use the value set in the config.
         '''
 
-        self._client = (client or build_client(session_config))
+        self._client = client
+        self._session_config = session_config
         self._logger = (logger or self._build_logger())
+        self._quota_cache = (None, 0.0)
+        self._sending_enabled = None
+
+        if quota_cache_ttl is None:
+            quota_cache_ttl = SES_SENDING_QUOTA_CACHE_TTL
+
+        self.quota_cache_ttl = quota_cache_ttl
 
     @property
     def client(self):
         '''
-        obj (botocore.client.SES): The SES client.
+        obj (botocore.client.SES): The SES client, built on first access if one was not provided.
         '''
 
+        if self._client is None:
+            self._client = build_aws_client('ses', self._session_config)
+
         return self._client
 
     @property
@@ -90,11 +99,11 @@ class SesService(object):
                 Default is None, which will cause the current date to be used.
 
         Returns:
-            tuple: Tuple containing the metric statistics.
+            SesSendingStats: Named tuple containing the metric statistics.
                 volume (float): The total number of emails sent.
                 max_volume (float): The max number of emails allowed to be sent.
-                usage (float): Percentage of max_volume being utilized, 80% is represented as 80.
-                ts (str): ISO 8601 formatted timestamp string.
+                utilization_percent (float): Percentage of max_volume being utilized, 80% is represented as 80.
+                metric_iso_ts (str): ISO 8601 formatted timestamp string.
         '''
 
         ts = (event_iso_ts or iso8601_timestamp())
@@ -102,11 +111,11 @@ class SesService(object):
         volume = stats['SentLast24Hours']
         max_volume = stats['Max24HourSend']
         usage = get_utilization_percentage(volume, max_volume)
-        return (volume, max_volume, usage, ts)
+        return SesSendingStats(volume, max_volume, usage, ts)
 
     def get_account_sending_quota(self):
         '''
-        Fetch the account sending quota from AWS.
+        Fetch the account sending quota from AWS, reusing the last response while it is within the cache TTL.
 
         Returns:
             dict: AWS SES sending quota response.
@@ -115,7 +124,26 @@ class SesService(object):
                 SentLast24Hours (float): Emails sent in the last 24 hours.
         '''
 
-        return self.client.get_send_quota()
+        quota, fetched_at = self._quota_cache
+
+        if (quota is not None) and ((time.monotonic() - fetched_at) < self.quota_cache_ttl):
+            return quota
+
+        quota = self.client.get_send_quota()
+        self._quota_cache = (quota, time.monotonic())
+
+        return quota
+
+    def clear_account_sending_quota_cache(self):
+        '''
+        Clear the cached account sending quota, the next call will fetch it from AWS.
+
+        Returns:
+            self (SesService): SesService instance.
+        '''
+
+        self._quota_cache = (None, 0.0)
+        return self
 
     def get_account_sending_current_percentage(self):
         '''
@@ -137,14 +165,7 @@ class SesService(object):
             float: A float representing the percentage. Ex: 80% is 80.
         '''
 
-        current_percentage = self.get_account_sending_current_percentage()
-
-        remaining = 100 - current_percentage
-
-        if remaining <= 0:
-            return 0
-
-        return remaining
+        return max(0, 100 - self.get_account_sending_current_percentage())
 
     def is_account_sending_rate_over(self, percent=None):
         '''
@@ -169,13 +190,28 @@ class SesService(object):
 
     def is_account_sending_enabled(self):
         '''
-        Check if account sending is enabled.
+        Check if account sending is enabled. The result is cached until clear_account_sending_enabled_cache is called,
+        enabling or disabling account sending updates the cached value.
 
         Returns:
             bool: True if account sending is enabled, False if disabled.
         '''
 
-        return self.client.get_account_sending_enabled()['Enabled']
+        if self._sending_enabled is None:
+            self._sending_enabled = self.client.get_account_sending_enabled()['Enabled']
+
+        return self._sending_enabled
+
+    def clear_account_sending_enabled_cache(self):
+        '''
+        Clear the cached account sending enabled state, the next call will fetch it from AWS.
+
+        Returns:
+            self (SesService): SesService instance.
+        '''
+
+        self._sending_enabled = None
+        return self
 
     def toggle_account_sending(self):
         '''
@@ -205,6 +241,7 @@ class SesService(object):
         self._log_enable_account_sending_request()
 
         self.client.update_account_sending_enabled(Enabled=True)
+        self._sending_enabled = True
 
         self._log_enable_account_sending_response()
 
@@ -221,6 +258,7 @@ class SesService(object):
         self._log_disable_account_sending_request()
 
         self.client.update_account_sending_enabled(Enabled=False)
+        self._sending_enabled = False
 
         self._log_disable_account_sending_response()
 
@@ -235,7 +273,10 @@ class SesService(object):
         '''
 
         logger = logging.getLogger(self.__module__)
-        logger.addHandler(logging.NullHandler())
+
+        if not logger.handlers:
+            logger.addHandler(logging.NullHandler())
+
         return logger
 
     def _log_enable_account_sending_request(self):
@@ -245,9 +286,10 @@ class SesService(object):
 
         self.logger.debug('Preparing to enable SES account sending...')
 
-        self.logger.info(
-            json_dump_request_event(class_name=self.__class__.__name__,
-                                    method_name='enable_account_sending_request'))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                json_dump_request_event(class_name=self.__class__.__name__,
+                                        method_name='enable_account_sending_request'))
 
     def _log_enable_account_sending_response(self):
         '''
@@ -256,9 +298,10 @@ class SesService(object):
 
         self.logger.debug('SES account sending ENABLED!')
 
-        self.logger.info(
-            json_dump_response_event(class_name=self.__class__.__name__,
-                                     method_name='enable_account_sending_request'))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                json_dump_response_event(class_name=self.__class__.__name__,
+                                         method_name='enable_account_sending_request'))
 
     def _log_disable_account_sending_request(self):
         '''
@@ -267,9 +310,10 @@ class SesService(object):
 
         self.logger.debug('Preparing to disable SES account sending...')
 
-        self.logger.info(
-            json_dump_request_event(class_name=self.__class__.__name__,
-                                    method_name='disable_account_sending_request'))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                json_dump_request_event(class_name=self.__class__.__name__,
+                                        method_name='disable_account_sending_request'))
 
     def _log_disable_account_sending_response(self):
         '''
@@ -278,6 +322,7 @@ class SesService(object):
 
         self.logger.debug('SES account sending DISABLED!')
 
-        self.logger.info(
-            json_dump_response_event(class_name=self.__class__.__name__,
-                                     method_name='disable_account_sending_request'))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                json_dump_response_event(class_name=self.__class__.__name__,
+                                         method_name='disable_account_sending_request'))
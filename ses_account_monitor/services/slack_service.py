@@ -132,7 +132,7 @@ class SlackService(HttpClient):
                 send_status (bool): Returns True when notifications were actually sent, if False a dry run was executed.
                 responses (:obj:`list` of :obj:`tuple`):
                     channel (str): The Slack channel the message was sent to.
-                    responses (:obj:`list` of :obj:`requests.Response/dict`): List of response objects.
+                    responses (:obj:`list` of :obj:`HttpResponse/dict`): List of response objects.
                         If a dry run occurred, will return dict objects containing the params for the request.
         '''
 
@@ -156,13 +156,11 @@ class SlackService(HttpClient):
         while self.messages:
             message = self.messages.popleft()
 
-            for channel in self.channels:
+            for payload in self._build_message_with_channels(message):
+                channel = payload['channel']
                 self.logger.debug('Sending Slack notification to %s...', channel)
 
-                payload = {'channel': channel}
-                payload.update(message)
-
-                response = self.post_json(payload=message)
+                response = self.post_json(payload=payload)
                 self.responses.append((channel, response))
 
         return (send_status, self.responses)
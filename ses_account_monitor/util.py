@@ -8,11 +8,21 @@ SES account monitor util module.
 '''
 
 import json
+import logging
 
 from datetime import (
     datetime,
     timezone)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+TRUE_VALUES = frozenset(('y', 'yes', 't', 'true', 'on', '1'))
+FALSE_VALUES = frozenset(('n', 'no', 'f', 'false', 'off', '0'))
+
 
 class CustomJsonEncoder(json.JSONEncoder):
     '''
@@ -35,9 +45,23 @@ class CustomJsonEncoder(json.JSONEncoder):
             return str(o)
 
 
+def orjson_default(o):
+    '''
+    Fallback serializer for orjson, coerces anything orjson does not support natively to a string.
+
+    Args:
+        o (obj): Object to serialize.
+
+    Returns:
+        str: String representation of the object.
+    '''
+
+    return str(o)
+
+
 def json_dump(obj):
     '''
-    Function for serializing a object to JSON with the CustomJsonEncoder serializer.
+    Function for serializing a object to JSON, uses orjson when it is installed, otherwise the CustomJsonEncoder serializer.
 
     Args:
         obj (obj): Object to serialize.
@@ -46,6 +70,9 @@ def json_dump(obj):
         str: JSON.
     '''
 
+    if orjson is not None:
+        return orjson.dumps(obj, default=orjson_default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
     return json.dumps(obj, cls=CustomJsonEncoder)
 
 
@@ -72,7 +99,7 @@ def json_dump_request_event(class_name, method_name, params=None, details=None):
         'details':  details
     }
 
-    return json.dumps(event, cls=CustomJsonEncoder)
+    return json_dump(event)
 
 
 def json_dump_response_event(class_name, method_name, response=None, details=None):
@@ -98,7 +125,52 @@ def json_dump_response_event(class_name, method_name, response=None, details=Non
         'details':  details
     }
 
-    return json.dumps(event, cls=CustomJsonEncoder)
+    return json_dump(event)
+
+
+def strtobool(value):
+    '''
+    Function to convert a string representation of truth to a bool, replaces distutils.util.strtobool.
+
+    Args:
+        value (str): The value to convert. Ex: y, yes, t, true, on, 1, n, no, f, false, off, 0.
+
+    Returns:
+        bool: True or False.
+
+    Raises:
+        ValueError: If the value is not a recognized truth value.
+    '''
+
+    value = value.lower()
+
+    if value in TRUE_VALUES:
+        return True
+
+    if value in FALSE_VALUES:
+        return False
+
+    raise ValueError('invalid truth value {!r}'.format(value))
+
+
+def get_log_level(level_name, default=logging.INFO):
+    '''
+    Function to resolve a log level name to its numeric level.
+
+    Args:
+        level_name (str): The log level name, case insensitive. Ex: info, WARNING.
+        default (:obj:`int`, optional): The level to use if the name is not a known level. Defaults to logging.INFO.
+
+    Returns:
+        int: The numeric log level.
+    '''
+
+    level = logging.getLevelName(level_name.upper())
+
+    if isinstance(level, int):
+        return level
+
+    return default
 
 
 def unix_timestamp(dt=None):
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from ses_account_monitor.clients.aws_client import (
+    build_aws_client,
+    get_default_session)
+
+
+@pytest.fixture
+def default_session(monkeypatch):
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-west-2')
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'a')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'b')
+
+    get_default_session.cache_clear()
+    yield get_default_session()
+    get_default_session.cache_clear()
+
+
+def test_build_aws_client_shares_default_session(default_session):
+    ses_client = build_aws_client('ses')
+    cloudwatch_client = build_aws_client('cloudwatch')
+
+    assert ses_client.meta.service_model.service_name == 'ses'
+    assert cloudwatch_client.meta.service_model.service_name == 'cloudwatch'
+    assert get_default_session() is default_session
+    assert get_default_session.cache_info().misses == 1
+
+
+def test_build_aws_client_with_session_config(default_session):
+    client = build_aws_client('ses', {'region_name': 'eu-west-1',
+                                      'aws_access_key_id': 'a',
+                                      'aws_secret_access_key': 'b'})
+
+    assert client.meta.region_name == 'eu-west-1'
+    assert get_default_session.cache_info().misses == 1
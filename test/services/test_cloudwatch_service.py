@@ -7,7 +7,9 @@ import boto3
 import pytest
 
 from botocore.stub import Stubber
-from ses_account_monitor.services.cloudwatch_service import CloudWatchService
+from ses_account_monitor.services.cloudwatch_service import (
+    CloudWatchService,
+    summarize_metric_data_response)
 
 
 @pytest.fixture
@@ -161,3 +163,63 @@ def test_get_ses_account_reputation_metrics(client,
         assert result.ok == [('Bounce Rate', 3.0, 5.0, '2018-06-17T02:11:25.787402+00:00'),
                              ('Complaint Rate', 0.00001, 0.01, '2018-06-17T02:11:25.787402+00:00')]
         assert result.warning == []
+
+
+def test_build_ses_account_reputation_metric_params_reuses_queries(service, metric_data_results_params, start_datetime, end_datetime):
+    first_params = service.build_ses_account_reputation_metric_params(target_datetime=start_datetime)
+    second_params = service.build_ses_account_reputation_metric_params(target_datetime=end_datetime)
+
+    assert second_params == metric_data_results_params
+    assert first_params['MetricDataQueries'] is second_params['MetricDataQueries']
+
+
+def test_build_ses_account_reputation_metric_params_custom_period(client, end_datetime):
+    service = CloudWatchService(client=client, ses_reputation_period=300, ses_reputation_metric_timedelta=600)
+
+    params = service.build_ses_account_reputation_metric_params(target_datetime=end_datetime)
+
+    assert service.ses_reputation_period == 300
+    assert [query['MetricStat']['Period'] for query in params['MetricDataQueries']] == [300, 300]
+    assert params['StartTime'] == datetime(2018, 6, 17, 2, 1, 25, 787402, tzinfo=timezone.utc)
+    assert params['EndTime'] == end_datetime
+
+
+def test_summarize_metric_data_response(metric_data_results_response):
+    metric_data_results_response['ResponseMetadata'] = {'RequestId': 'abc-123'}
+
+    result = summarize_metric_data_response(metric_data_results_response)
+
+    assert result == {
+        'metrics': [('Bounce Rate', 3.0, '2018-06-17T02:11:25.787402+00:00'),
+                    ('Complaint Rate', 0.00001, '2018-06-17T02:11:25.787402+00:00')],
+        'request_id': 'abc-123'
+    }
+
+
+def test_ses_thresholds_setter(service, build_metric_data_results):
+    service.ses_thresholds = {
+        'CRITICAL': {'bounce_rate': 3, 'complaint_rate': 1},
+        'WARNING': {'bounce_rate': 2, 'complaint_rate': 0.5}
+    }
+
+    result = service.build_ses_account_reputation_metrics(build_metric_data_results(0.05, 0.001))
+
+    assert result.critical == [('Bounce Rate', 5.0, 3, '2018-06-17T02:11:25.787402+00:00')]
+    assert result.ok == [('Complaint Rate', 0.1, 0.5, '2018-06-17T02:11:25.787402+00:00')]
+    assert result.warning == []
+
+
+def test_prewarm_builds_client_once(monkeypatch, client):
+    build_calls = []
+
+    def build_aws_client(service_name, session_config=None):
+        build_calls.append((service_name, session_config))
+        return client
+
+    monkeypatch.setattr('ses_account_monitor.services.cloudwatch_service.build_aws_client', build_aws_client)
+
+    service = CloudWatchService(session_config={'region_name': 'us-west-2'})
+
+    assert service.prewarm() is service
+    assert service.client is client
+    assert build_calls == [('cloudwatch', {'region_name': 'us-west-2'})]
@@ -4,7 +4,6 @@ from datetime import (
   timezone)
 
 import pytest
-import responses
 
 from ses_account_monitor.services.pager_duty_service import PagerDutyService
 
@@ -100,23 +99,23 @@ def metrics(iso8601_date):
             ('Complaint Rate', 1, 1, iso8601_date)]
 
 
-@responses.activate
-def test_post_message(service, webhook_url):
-    with responses.RequestsMock(target='botocore.vendored.requests.adapters.HTTPAdapter.send') as rsps:
-        rsps.add(
-            responses.POST,
-            webhook_url,
-            status=202,
-            json={
-                'status': 'success',
-                'message': 'Event processed',
-                'dedup_key': 'samplekeyhere'
-            }
-        )
+def test_post_message(http_stub, service, webhook_url):
+    http_stub.add(
+        'POST',
+        webhook_url,
+        status=202,
+        json_body={
+            'status': 'success',
+            'message': 'Event processed',
+            'dedup_key': 'samplekeyhere'
+        }
+    )
 
-        result = service.post_json({})
+    result = service.post_json({})
 
-        assert result.status_code == 202
+    assert result.status_code == 202
+    assert result.json() == {'status': 'success', 'message': 'Event processed', 'dedup_key': 'samplekeyhere'}
+    assert http_stub.requests == [('POST', webhook_url, b'{}', {'Content-Type': 'application/json'})]
 
 
 def test_build_ses_account_sending_quota_trigger_event_payload(service, ses_account_sending_quota_trigger_event_payload, iso8601_date):
@@ -154,43 +153,42 @@ def test_build_ses_account_reputation_resolve_event_payload(service, build_resol
     assert result == build_resolve_event_payload('ses_account_reputation')
 
 
-def test_send_events(service, webhook_url, iso8601_date, metrics):
-    with responses.RequestsMock(target='botocore.vendored.requests.adapters.HTTPAdapter.send') as rsps:
-        rsps.add(
-            responses.POST,
-            webhook_url,
-            status=202,
-            json={
-                'status': 'success',
-                'message': 'Event processed',
-                'dedup_key': 'samplekeyhere'
-            }
-        )
+def test_send_events(http_stub, service, webhook_url, iso8601_date, metrics):
+    http_stub.add(
+        'POST',
+        webhook_url,
+        status=202,
+        json_body={
+            'status': 'success',
+            'message': 'Event processed',
+            'dedup_key': 'samplekeyhere'
+        }
+    )
 
-        service.enqueue_ses_account_sending_quota_trigger_event(volume=9001,
-                                                                max_volume=9001,
-                                                                utilization_percent=100,
-                                                                threshold_percent=100,
-                                                                event_iso_ts=iso8601_date,
-                                                                metric_ts=123456789)
+    service.enqueue_ses_account_sending_quota_trigger_event(volume=9001,
+                                                            max_volume=9001,
+                                                            utilization_percent=100,
+                                                            threshold_percent=100,
+                                                            event_iso_ts=iso8601_date,
+                                                            metric_ts=123456789)
 
-        service.enqueue_ses_account_sending_quota_resolve_event()
+    service.enqueue_ses_account_sending_quota_resolve_event()
 
-        service.enqueue_ses_account_reputation_trigger_event(metrics=metrics,
-                                                             event_iso_ts=iso8601_date,
-                                                             event_unix_ts=123456789)
+    service.enqueue_ses_account_reputation_trigger_event(metrics=metrics,
+                                                         event_iso_ts=iso8601_date,
+                                                         event_unix_ts=123456789)
 
-        service.enqueue_ses_account_reputation_resolve_event()
+    service.enqueue_ses_account_reputation_resolve_event()
 
-        send_status, requests = service.send_notifications()
+    send_status, requests = service.send_notifications()
 
-        assert send_status is True
+    assert send_status is True
 
-        expected_eids = ['trigger::undefined-None-undefined-ses-account-monitor/ses_account_sending_quota',
-                         'resolve::undefined-None-undefined-ses-account-monitor/ses_account_sending_quota',
-                         'trigger::undefined-None-undefined-ses-account-monitor/ses_account_reputation',
-                         'resolve::undefined-None-undefined-ses-account-monitor/ses_account_reputation']
+    expected_eids = ['trigger::undefined-None-undefined-ses-account-monitor/ses_account_sending_quota',
+                     'resolve::undefined-None-undefined-ses-account-monitor/ses_account_sending_quota',
+                     'trigger::undefined-None-undefined-ses-account-monitor/ses_account_reputation',
+                     'resolve::undefined-None-undefined-ses-account-monitor/ses_account_reputation']
 
-        for idx, (eid, request) in enumerate(requests):
-            assert eid == expected_eids[idx]
-            assert request.status_code == 202
+    for idx, (eid, request) in enumerate(requests):
+        assert eid == expected_eids[idx]
+        assert request.status_code == 202
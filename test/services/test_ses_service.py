@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import logging
+
 from datetime import (
     datetime,
     timezone)
@@ -23,6 +25,11 @@ def service(client):
     return SesService(client=client)
 
 
+@pytest.fixture
+def uncached_service(client):
+    return SesService(client=client, quota_cache_ttl=0)
+
+
 @pytest.fixture
 def ses_quota_responses():
     return (({
@@ -72,7 +79,7 @@ def test_get_account_sending_quota(client, service, ses_quota_responses):
         }
 
 
-def test_is_account_sending_rate_over(client, service, ses_quota_responses):
+def test_is_account_sending_rate_over(client, uncached_service, ses_quota_responses):
     stubber = Stubber(client)
 
     for response, percentage, expected_result in ses_quota_responses:
@@ -81,13 +88,72 @@ def test_is_account_sending_rate_over(client, service, ses_quota_responses):
                              {})
         stubber.activate()
 
-        result = service.is_account_sending_rate_over(percentage)
+        result = uncached_service.is_account_sending_rate_over(percentage)
 
         stubber.deactivate()
 
         assert result == expected_result
 
 
+def test_get_account_sending_quota_cached(client, ses_quota_responses):
+    service = SesService(client=client, quota_cache_ttl=60)
+    stubber = Stubber(client)
+
+    stubber.add_response('get_send_quota',
+                         ses_quota_responses[0][0],
+                         {})
+
+    with stubber:
+        first_result = service.get_account_sending_quota()
+        second_result = service.get_account_sending_quota()
+
+        assert first_result is second_result
+        stubber.assert_no_pending_responses()
+
+
+def test_get_account_sending_quota_not_cached_by_default(client, service, ses_quota_responses):
+    stubber = Stubber(client)
+
+    stubber.add_response('get_send_quota',
+                         ses_quota_responses[0][0],
+                         {})
+    stubber.add_response('get_send_quota',
+                         ses_quota_responses[1][0],
+                         {})
+
+    with stubber:
+        first_result = service.get_account_sending_quota()
+        second_result = service.get_account_sending_quota()
+
+        assert first_result['SentLast24Hours'] == 0.0
+        assert second_result['SentLast24Hours'] == 123.0
+        stubber.assert_no_pending_responses()
+
+
+def test_client_built_on_first_access(monkeypatch, client):
+    build_calls = []
+
+    def build_aws_client(service_name, session_config=None):
+        build_calls.append((service_name, session_config))
+        return client
+
+    monkeypatch.setattr('ses_account_monitor.services.ses_service.build_aws_client', build_aws_client)
+
+    service = SesService(session_config={'region_name': 'us-west-2'})
+
+    assert build_calls == []
+    assert service.client is client
+    assert service.client is client
+    assert build_calls == [('ses', {'region_name': 'us-west-2'})]
+
+
+def test_build_logger_adds_one_handler(client):
+    SesService(client=client)
+    SesService(client=client)
+
+    assert len(logging.getLogger('ses_account_monitor.services.ses_service').handlers) == 1
+
+
 def test_toggle_account_sending(client, service):
     stubber = Stubber(client)
 
@@ -97,9 +163,6 @@ def test_toggle_account_sending(client, service):
     stubber.add_response('update_account_sending_enabled',
                          {},
                          {'Enabled': False})
-    stubber.add_response('get_account_sending_enabled',
-                         {'Enabled': False},
-                         {})
     stubber.add_response('update_account_sending_enabled',
                          {},
                          {'Enabled': True})
@@ -112,6 +175,31 @@ def test_toggle_account_sending(client, service):
         assert enable_result is True
 
 
+def test_is_account_sending_enabled_cached(client, service):
+    stubber = Stubber(client)
+
+    stubber.add_response('get_account_sending_enabled',
+                         {'Enabled': False},
+                         {})
+    stubber.add_response('update_account_sending_enabled',
+                         {},
+                         {'Enabled': True})
+    stubber.add_response('get_account_sending_enabled',
+                         {'Enabled': False},
+                         {})
+
+    with stubber:
+        assert service.is_account_sending_enabled() is False
+        assert service.is_account_sending_enabled() is False
+
+        service.enable_account_sending()
+        assert service.is_account_sending_enabled() is True
+
+        service.clear_account_sending_enabled_cache()
+        assert service.is_account_sending_enabled() is False
+        stubber.assert_no_pending_responses()
+
+
 def test_enable_account_sending(client, service):
     stubber = Stubber(client)
     stubber.add_response('update_account_sending_enabled',
@@ -123,6 +211,26 @@ def test_enable_account_sending(client, service):
         assert result is True
 
 
+def test_enable_account_sending_skips_info_log_serialization(monkeypatch, client):
+    def json_dump_event(*args, **kwargs):
+        raise AssertionError('event serialized while INFO is disabled')
+
+    monkeypatch.setattr('ses_account_monitor.services.ses_service.json_dump_request_event', json_dump_event)
+    monkeypatch.setattr('ses_account_monitor.services.ses_service.json_dump_response_event', json_dump_event)
+
+    logger = logging.getLogger('test_ses_service.warning')
+    logger.setLevel(logging.WARNING)
+    service = SesService(client=client, logger=logger)
+
+    stubber = Stubber(client)
+    stubber.add_response('update_account_sending_enabled',
+                         {},
+                         {'Enabled': True})
+
+    with stubber:
+        assert service.enable_account_sending() is True
+
+
 def test_disable_account_sending(client, service):
     stubber = Stubber(client)
     stubber.add_response('update_account_sending_enabled',
@@ -134,7 +242,7 @@ def test_disable_account_sending(client, service):
         assert result is False
 
 
-def test_get_account_sending_current_percentage(client, service):
+def test_get_account_sending_current_percentage(client, uncached_service):
     stubber = Stubber(client)
 
     stubber.add_response('get_send_quota',
@@ -152,14 +260,14 @@ def test_get_account_sending_current_percentage(client, service):
                          },
                          {})
     with stubber:
-        zero_result = service.get_account_sending_current_percentage()
+        zero_result = uncached_service.get_account_sending_current_percentage()
         assert zero_result == 0
 
-        hundred_result = service.get_account_sending_current_percentage()
+        hundred_result = uncached_service.get_account_sending_current_percentage()
         assert hundred_result > 100
 
 
-def test_get_account_sending_remaining_percentage(client, service):
+def test_get_account_sending_remaining_percentage(client, uncached_service):
     stubber = Stubber(client)
 
     stubber.add_response('get_send_quota',
@@ -177,10 +285,10 @@ def test_get_account_sending_remaining_percentage(client, service):
                          },
                          {})
     with stubber:
-        hundred_result = service.get_account_sending_remaining_percentage()
+        hundred_result = uncached_service.get_account_sending_remaining_percentage()
         assert hundred_result == 100
 
-        zero_result = service.get_account_sending_remaining_percentage()
+        zero_result = uncached_service.get_account_sending_remaining_percentage()
         assert zero_result == 0
 
 
@@ -199,3 +307,4 @@ def test_get_account_sending_stats(client, service, iso8601_date):
         result = service.get_account_sending_stats(event_iso_ts=iso8601_date)
 
         assert result == (10.0, 50.0, 20.0, '2018-01-01T00:00:00+00:00')
+        assert result.utilization_percent == 20.0
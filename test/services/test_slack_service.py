@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
+import json
+
 from datetime import (
     datetime,
     timezone)
 
 import pytest
-import responses
 
 from ses_account_monitor.services.slack_service import SlackService
 
@@ -108,21 +109,19 @@ def ses_account_reputation_payload():
         'username': 'SES Account Monitor'}
 
 
-@responses.activate
-def test_post_message(service, webhook_url):
-    with responses.RequestsMock(target='botocore.vendored.requests.adapters.HTTPAdapter.send') as rsps:
-        rsps.add(
-            responses.POST,
-            webhook_url,
-            status=200,
-            json={
-                'ok': True
-            }
-        )
+def test_post_message(http_stub, service, webhook_url):
+    http_stub.add(
+        'POST',
+        webhook_url,
+        status=200,
+        json_body={
+            'ok': True
+        }
+    )
 
-        result = service.post_json({})
+    result = service.post_json({})
 
-        assert result.status_code == 200
+    assert result.status_code == 200
 
 
 @pytest.fixture
@@ -157,40 +156,84 @@ def test_build_ses_account_reputation_payload(service, ses_account_reputation_pa
     assert result == ses_account_reputation_payload
 
 
-@responses.activate
-def test_send_notifications(service, webhook_url, metrics):
-    with responses.RequestsMock(target='botocore.vendored.requests.adapters.HTTPAdapter.send') as rsps:
-        rsps.add(
-            responses.POST,
-            webhook_url,
-            status=200,
-            json={
-                'ok': True
-            }
-        )
-
-        service.enqueue_ses_account_sending_quota_message(threshold_name='CRITICAL',
-                                                          utilization_percent=100,
-                                                          threshold_percent=90,
-                                                          volume=9000,
-                                                          max_volume=9000,
-                                                          event_unix_ts=123456789)
+def test_send_notifications(http_stub, service, webhook_url, metrics):
+    http_stub.add(
+        'POST',
+        webhook_url,
+        status=200,
+        json_body={
+            'ok': True
+        }
+    )
+
+    service.enqueue_ses_account_sending_quota_message(threshold_name='CRITICAL',
+                                                      utilization_percent=100,
+                                                      threshold_percent=90,
+                                                      volume=9000,
+                                                      max_volume=9000,
+                                                      event_unix_ts=123456789)
+
+    service.enqueue_ses_account_sending_quota_message(threshold_name='CRITICAL',
+                                                      utilization_percent=100,
+                                                      threshold_percent=90,
+                                                      volume=9000,
+                                                      max_volume=9000,
+                                                      event_unix_ts=123456789)
+
+    service.enqueue_ses_account_reputation_message(threshold_name='WARNING',
+                                                   metrics=metrics,
+                                                   event_unix_ts=123456789)
+
+    send_status, requests = service.send_notifications()
+
+    assert send_status is True
+
+    for channel, request in requests:
+        assert channel == '#general'
+        assert request.status_code == 200
+
+    assert len(http_stub.requests) == 3
+
+    for method, url, body, headers in http_stub.requests:
+        assert json.loads(body.decode('utf-8'))['channel'] == '#general'
+
+
+def test_send_notifications_empty_message(http_stub, service, webhook_url):
+    http_stub.add(
+        'POST',
+        webhook_url,
+        status=200,
+        json_body={
+            'ok': True
+        }
+    )
+
+    service.messages.append({})
+
+    service.send_notifications()
+
+    method, url, body, headers = http_stub.requests[0]
+
+    assert json.loads(body.decode('utf-8')) == {'channel': '#general'}
 
-        service.enqueue_ses_account_sending_quota_message(threshold_name='CRITICAL',
-                                                          utilization_percent=100,
-                                                          threshold_percent=90,
-                                                          volume=9000,
-                                                          max_volume=9000,
-                                                          event_unix_ts=123456789)
 
-        service.enqueue_ses_account_reputation_message(threshold_name='WARNING',
-                                                       metrics=metrics,
-                                                       event_unix_ts=123456789)
+def test_send_notifications_posts_each_channel(http_stub, webhook_url):
+    http_stub.add(
+        'POST',
+        webhook_url,
+        status=200,
+        json_body={
+            'ok': True
+        }
+    )
 
-        send_status, requests = service.send_notifications()
+    service = SlackService(url=webhook_url, channels=['#general', '#alerts'])
+    service.messages.append({'text': 'hello'})
 
-        assert send_status is True
+    send_status, responses = service.send_notifications()
 
-        for channel, request in requests:
-            assert channel == '#general'
-            assert request.status_code == 200
+    assert [channel for channel, response in responses] == ['#general', '#alerts']
+    assert [json.loads(body.decode('utf-8')) for method, url, body, headers in http_stub.requests] == [
+        {'channel': '#general', 'text': 'hello'},
+        {'channel': '#alerts', 'text': 'hello'}
+    ]
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from ses_account_monitor import config
+from ses_account_monitor.configs import SlackServiceConfig
+
+
+def test_service_configs_use_console_urls():
+    assert isinstance(config.SLACK_SERVICE_CONFIG, SlackServiceConfig)
+    assert config.SLACK_SERVICE_CONFIG.ses_console_url == config.SES_CONSOLE_URL
+    assert config.SES_CONSOLE_URL.startswith(config.build_ses_base_url())
+
+
+def test_session_config_is_read_only():
+    with pytest.raises(TypeError):
+        config.LAMBDA_AWS_SESSION_CONFIG['region_name'] = 'us-east-1'
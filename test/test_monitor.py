@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import logging
+import time
+
 from collections import deque
 from datetime import (
     datetime,
@@ -6,12 +9,14 @@ from datetime import (
 
 import boto3
 import pytest
-import responses
 
 from botocore.stub import Stubber
 
 from ses_account_monitor.configs.notify_config import NotifyConfig
-from ses_account_monitor.monitor import Monitor
+from ses_account_monitor.monitor import (
+    Monitor,
+    NotificationFailure)
+from ses_account_monitor.services.cloudwatch_service import SesReputationMetrics
 from ses_account_monitor.services import (
     CloudWatchService,
     SesService,
@@ -472,8 +477,7 @@ def test_handle_ses_reputation_ok(monitor, end_datetime, metric_data_results_res
     assert result == {'pager_duty': deque([]), 'slack': deque([])}
 
 
-@responses.activate
-def test_send_notifications_critical(monitor, end_datetime, metric_data_results_response_critical, metric_data_results_params):
+def test_send_notifications_critical(http_stub, monitor, end_datetime, metric_data_results_response_critical, metric_data_results_params):
     ses_stubber = Stubber(monitor.ses_service.client)
     ses_stubber.add_response('get_send_quota',
                              {
@@ -490,30 +494,295 @@ def test_send_notifications_critical(monitor, end_datetime, metric_data_results_
                                     metric_data_results_params)
     cloudwatch_stubber.activate()
 
-    with responses.RequestsMock(target='botocore.vendored.requests.adapters.HTTPAdapter.send') as rsps:
-        rsps.add(
-            responses.POST,
-            monitor.pager_duty_service.url,
-            status=202,
-            json={
-                'status': 'success',
-                'message': 'Event processed',
-                'dedup_key': 'samplekeyhere'
-            }
-        )
-
-        rsps.add(
-            responses.POST,
-            monitor.slack_service.url,
-            status=200,
-            json={
-                'ok': True
-            }
-        )
+    http_stub.add(
+        'POST',
+        monitor.pager_duty_service.url,
+        status=202,
+        json_body={
+            'status': 'success',
+            'message': 'Event processed',
+            'dedup_key': 'samplekeyhere'
+        }
+    )
+
+    http_stub.add(
+        'POST',
+        monitor.slack_service.url,
+        status=200,
+        json_body={
+            'ok': True
+        }
+    )
+
+    monitor.handle_ses_sending_quota(target_datetime=end_datetime)
+    monitor.handle_ses_reputation(target_datetime=end_datetime)
+    result = monitor.send_notifications(raise_on_errors=True)
+
+    assert len(result['pager_duty']) == 2
+    assert len(result['slack']) == 2
+
+
+def test_reset(monitor, target_datetime):
+    ses_stubber = Stubber(monitor.ses_service.client)
+    ses_stubber.add_response('get_send_quota',
+                             {
+                                 'Max24HourSend': 10.0,
+                                 'MaxSendRate': 523.0,
+                                 'SentLast24Hours': 15.0
+                             },
+                             {})
+    ses_stubber.activate()
+
+    result = monitor.handle_ses_sending_quota(target_datetime=target_datetime)
+
+    assert len(result['pager_duty']) == 1
+    assert len(result['slack']) == 1
+
+    monitor.reset()
+
+    assert monitor._get_pending_notifications() == {'pager_duty': deque([]), 'slack': deque([])}
+    assert monitor._get_notification_responses() == {'pager_duty': [], 'slack': []}
+
+
+def test_prewarm_clients(monitor):
+    ses_stubber = Stubber(monitor.ses_service.client)
+    ses_stubber.add_response('get_send_quota',
+                             {
+                                 'Max24HourSend': 10.0,
+                                 'MaxSendRate': 523.0,
+                                 'SentLast24Hours': 1.0
+                             },
+                             {})
+
+    with ses_stubber:
+        assert monitor.prewarm_clients() is monitor
+        ses_stubber.assert_no_pending_responses()
+
+
+def test_prewarm_clients_ignores_errors(monitor):
+    ses_stubber = Stubber(monitor.ses_service.client)
+    ses_stubber.add_client_error('get_send_quota', service_error_code='Throttling')
+
+    with ses_stubber:
+        assert monitor.prewarm_clients() is monitor
+
+
+def test_handle_invalid_strategy(notify_config, ses_service, cloudwatch_service, slack_service):
+    monitor = Monitor(ses_management_strategy='unknown',
+                      notify_config=notify_config,
+                      ses_service=ses_service,
+                      cloudwatch_service=cloudwatch_service,
+                      slack_service=slack_service)
+
+    with Stubber(ses_service.client), Stubber(cloudwatch_service.client):
+        assert monitor.handle_ses_sending_quota() == {}
+        assert monitor.handle_ses_reputation() == {}
+
+
+def test_begin_invocation(monitor, target_datetime):
+    monitor.begin_invocation(target_datetime=target_datetime)
+
+    assert monitor._get_timestamps() == (target_datetime, '2018-01-01T00:00:00+00:00', 1514764800)
+
+    monitor.reset()
+
+    assert monitor._get_timestamps(target_datetime) == (target_datetime, '2018-01-01T00:00:00+00:00', 1514764800)
+    assert monitor._invocation_timestamps is None
+
+
+def test_send_notifications_raises_on_server_errors(http_stub, monitor):
+    http_stub.add(
+        'POST',
+        monitor.slack_service.url,
+        status=503,
+        json_body={
+            'ok': False
+        }
+    )
+
+    monitor.slack_service.messages.append({'text': 'hello'})
+
+    with pytest.raises(NotificationFailure, match='Slack: #general, status: 503') as exc_info:
+        monitor.send_notifications(raise_on_errors=True)
+
+    assert exc_info.value.failures == [('Slack', '#general', 503)]
+
+
+def test_send_notifications_skips_disabled_services(monkeypatch, ses_service, cloudwatch_service, slack_service):
+    def send_notifications(*args, **kwargs):
+        raise AssertionError('disabled service was sent notifications')
+
+    monkeypatch.setattr(slack_service, 'send_notifications', send_notifications)
+
+    monitor = Monitor(notify_config=NotifyConfig(notify_pager_duty_on_ses_reputation=False,
+                                                 notify_pager_duty_on_ses_sending_quota=True,
+                                                 notify_slack_on_ses_reputation=False,
+                                                 notify_slack_on_ses_sending_quota=False),
+                      ses_service=ses_service,
+                      cloudwatch_service=cloudwatch_service,
+                      slack_service=slack_service)
+
+    assert monitor.send_notifications(raise_on_errors=True) == {'pager_duty': [], 'slack': []}
+
+
+def test_send_notifications_waits_for_all_services(monkeypatch, monitor):
+    finished = []
+
+    def send_pager_duty_notifications(*args, **kwargs):
+        raise RuntimeError('pager duty failed')
+
+    def send_slack_notifications(*args, **kwargs):
+        time.sleep(0.05)
+        finished.append('slack')
+
+    monkeypatch.setattr(monitor.pager_duty_service, 'send_notifications', send_pager_duty_notifications)
+    monkeypatch.setattr(monitor.slack_service, 'send_notifications', send_slack_notifications)
+
+    with pytest.raises(NotificationFailure, match='pager duty failed'):
+        monitor.send_notifications()
+
+    assert finished == ['slack']
+
+
+def test_send_notifications_reports_every_service_error(monkeypatch, monitor):
+    pager_duty_error = RuntimeError('pager duty failed')
+    slack_error = RuntimeError('slack failed')
+
+    def send_pager_duty_notifications(*args, **kwargs):
+        raise pager_duty_error
+
+    def send_slack_notifications(*args, **kwargs):
+        raise slack_error
+
+    monkeypatch.setattr(monitor.pager_duty_service, 'send_notifications', send_pager_duty_notifications)
+    monkeypatch.setattr(monitor.slack_service, 'send_notifications', send_slack_notifications)
+
+    with pytest.raises(NotificationFailure) as exc_info:
+        monitor.send_notifications()
+
+    assert exc_info.value.errors == [('PagerDuty', pager_duty_error), ('Slack', slack_error)]
+    assert exc_info.value.__cause__ is pager_duty_error
+
+
+def test_services_built_on_first_access(monkeypatch, notify_config):
+    built = []
+
+    class CloudWatchService(object):
+        def __init__(self, client=None):
+            built.append(client)
+
+    monkeypatch.setattr('ses_account_monitor.services.cloudwatch_service.CloudWatchService', CloudWatchService)
+
+    monitor = Monitor(notify_config=notify_config, cloudwatch_client='client')
+    monitor.reset()
+
+    assert built == []
+    assert monitor.cloudwatch_service is monitor.cloudwatch_service
+    assert built == ['client']
+
+
+def test_notifications_without_building_disabled_services(monkeypatch, ses_service, cloudwatch_service):
+    class NotificationService(object):
+        def __init__(self, *args, **kwargs):
+            raise AssertionError('disabled service was built')
+
+    monkeypatch.setattr('ses_account_monitor.services.pager_duty_service.PagerDutyService', NotificationService)
+    monkeypatch.setattr('ses_account_monitor.services.slack_service.SlackService', NotificationService)
+
+    monitor = Monitor(notify_config=NotifyConfig(notify_pager_duty_on_ses_reputation=False,
+                                                 notify_pager_duty_on_ses_sending_quota=False,
+                                                 notify_slack_on_ses_reputation=False,
+                                                 notify_slack_on_ses_sending_quota=False),
+                      ses_service=ses_service,
+                      cloudwatch_service=cloudwatch_service)
+
+    assert monitor._get_pending_notifications() == {'pager_duty': deque(), 'slack': deque()}
+    assert monitor.send_notifications(raise_on_errors=True) == {'pager_duty': [], 'slack': []}
+
+
+def test_ses_management_strategy(monitor):
+    monitor.ses_management_strategy = 'managed'
+
+    assert monitor._is_managed is True
+    assert monitor._is_valid_strategy is True
+
+    monitor.ses_management_strategy = 'unknown'
+
+    assert monitor._is_managed is False
+    assert monitor._is_valid_strategy is False
+
+
+def test_handle_ses_sending_quota_skips_info_log_serialization(monkeypatch, notify_config, ses_service, slack_service, target_datetime):
+    def json_dump_event(*args, **kwargs):
+        raise AssertionError('event serialized while INFO is disabled')
+
+    monkeypatch.setattr('ses_account_monitor.monitor.json_dump_request_event', json_dump_event)
+    monkeypatch.setattr('ses_account_monitor.monitor.json_dump_response_event', json_dump_event)
+
+    logger = logging.getLogger('test_monitor.warning')
+    logger.setLevel(logging.WARNING)
+
+    monitor = Monitor(notify_config=notify_config, ses_service=ses_service, slack_service=slack_service, logger=logger)
+
+    ses_stubber = Stubber(ses_service.client)
+    ses_stubber.add_response('get_send_quota',
+                             {
+                                 'Max24HourSend': 10.0,
+                                 'MaxSendRate': 523.0,
+                                 'SentLast24Hours': 15.0
+                             },
+                             {})
+
+    with ses_stubber:
+        result = monitor.handle_ses_sending_quota(target_datetime=target_datetime)
+
+    assert len(result['slack']) == 1
+
+
+def test_handle_ses_reputation_skips_debug_logs(monkeypatch, notify_config, cloudwatch_service, slack_service, end_datetime):
+    def get_ses_account_reputation_metrics(*args, **kwargs):
+        return SesReputationMetrics(critical=[], ok=[], warning=[])
+
+    def debug(*args, **kwargs):
+        raise AssertionError('debug logged while DEBUG is disabled')
+
+    monkeypatch.setattr(cloudwatch_service, 'get_ses_account_reputation_metrics', get_ses_account_reputation_metrics)
+
+    logger = logging.getLogger('test_monitor.reputation')
+    logger.setLevel(logging.WARNING)
+    monkeypatch.setattr(logger, 'debug', debug)
+
+    monitor = Monitor(notify_config=notify_config, cloudwatch_service=cloudwatch_service, slack_service=slack_service, logger=logger)
+
+    result = monitor.handle_ses_reputation(target_datetime=end_datetime)
+
+    assert len(result['slack']) == 0
+
+
+def test_reset_refreshes_log_levels(notify_config):
+    logger = logging.getLogger('test_monitor.levels')
+    logger.setLevel(logging.WARNING)
+
+    monitor = Monitor(notify_config=notify_config, logger=logger)
+
+    assert (monitor._dbg, monitor._info) == (False, False)
+
+    logger.setLevel(logging.DEBUG)
+    monitor.reset()
+
+    assert (monitor._dbg, monitor._info) == (True, True)
+
 
-        monitor.handle_ses_sending_quota(target_datetime=end_datetime)
-        monitor.handle_ses_reputation(target_datetime=end_datetime)
-        result = monitor.send_notifications(raise_on_errors=True)
+def test_handle_skips_when_notifications_disabled(ses_service, cloudwatch_service, slack_service):
+    monitor = Monitor(ses_management_strategy='alert',
+                      notify_config=NotifyConfig(notify_pager_duty_on_ses_reputation=False,
+                                                 notify_pager_duty_on_ses_sending_quota=False,
+                                                 notify_slack_on_ses_reputation=False,
+                                                 notify_slack_on_ses_sending_quota=False),
+                      ses_service=ses_service,
+                      cloudwatch_service=cloudwatch_service,
+                      slack_service=slack_service)
 
-        assert len(result['pager_duty']) == 2
-        assert len(result['slack']) == 2
+    with Stubber(ses_service.client), Stubber(cloudwatch_service.client):
+        assert monitor.handle_ses_sending_quota() == {}
+        assert monitor.handle_ses_reputation() == {}
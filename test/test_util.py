@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+
+from datetime import (
+    datetime,
+    timezone)
+
+from decimal import Decimal
+
+import pytest
+
+from ses_account_monitor import util
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def serializer(request, monkeypatch):
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(util, 'orjson', None)
+
+    return request.param
+
+
+def test_json_dump(serializer):
+    result = util.json_dump({
+        'StartTime': datetime(2018, 6, 17, 1, 41, 25, 787402, tzinfo=timezone.utc),
+        'Value': Decimal('0.5'),
+        'Name': 'bounce_rate'
+    })
+
+    assert json.loads(result) == {
+        'StartTime': '2018-06-17T01:41:25.787402+00:00',
+        'Value': '0.5',
+        'Name': 'bounce_rate'
+    }
+
+
+def test_strtobool():
+    assert util.strtobool('True') is True
+    assert util.strtobool('on') is True
+    assert util.strtobool('1') is True
+    assert util.strtobool('False') is False
+    assert util.strtobool('no') is False
+    assert util.strtobool('0') is False
+
+    with pytest.raises(ValueError):
+        util.strtobool('maybe')
+
+
+def test_get_log_level():
+    assert util.get_log_level('warning') == logging.WARNING
+    assert util.get_log_level('DEBUG') == logging.DEBUG
+    assert util.get_log_level('verbose') == logging.INFO